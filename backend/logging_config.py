@@ -250,16 +250,16 @@ def log_execution(logger: logging.Logger = None, level: int = logging.DEBUG):
             _logger = logger or get_logger(func.__module__)
             func_name = f"{func.__module__}.{func.__name__}"
             
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             _logger.log(level, f"[CALL] {func_name}")
             
             try:
                 result = await func(*args, **kwargs)
-                duration = (time.time() - start_time) * 1000
+                duration = (time.perf_counter_ns() - start_ns) / 1e6
                 _logger.log(level, f"[OK] {func_name} completed in {duration:.2f}ms")
                 return result
             except Exception as e:
-                duration = (time.time() - start_time) * 1000
+                duration = (time.perf_counter_ns() - start_ns) / 1e6
                 _logger.error(f"[FAIL] {func_name} failed after {duration:.2f}ms: {e}")
                 raise
         
@@ -268,16 +268,16 @@ def log_execution(logger: logging.Logger = None, level: int = logging.DEBUG):
             _logger = logger or get_logger(func.__module__)
             func_name = f"{func.__module__}.{func.__name__}"
             
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             _logger.log(level, f"[CALL] {func_name}")
             
             try:
                 result = func(*args, **kwargs)
-                duration = (time.time() - start_time) * 1000
+                duration = (time.perf_counter_ns() - start_ns) / 1e6
                 _logger.log(level, f"[OK] {func_name} completed in {duration:.2f}ms")
                 return result
             except Exception as e:
-                duration = (time.time() - start_time) * 1000
+                duration = (time.perf_counter_ns() - start_ns) / 1e6
                 _logger.error(f"[FAIL] {func_name} failed after {duration:.2f}ms: {e}")
                 raise
         
@@ -296,6 +296,8 @@ def log_execution(logger: logging.Logger = None, level: int = logging.DEBUG):
 class RequestLoggingMiddleware:
     """FastAPI middleware for request/response logging."""
     
+    SKIP_PATHS = frozenset({"/health", "/favicon.ico"})
+    
     def __init__(self, app, logger: logging.Logger = None):
         self.app = app
         self.logger = logger or api_logger
@@ -320,11 +322,11 @@ class RequestLoggingMiddleware:
         request_context.ip_address = client_ip
         
         # Skip health check and static files
-        if path in ["/health", "/favicon.ico"] or path.startswith("/static"):
+        if path in self.SKIP_PATHS or path.startswith("/static"):
             await self.app(scope, receive, send)
             return
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Log request
         self.logger.info(f"[REQ] {request_id} | {method} {path} | IP: {client_ip}")
@@ -344,7 +346,7 @@ class RequestLoggingMiddleware:
             self.logger.error(f"[ERR] {request_id} | {method} {path} | Error: {e}")
             raise
         finally:
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter_ns() - start_ns) / 1e6
             
             # Status indicator
             if status_code < 300:
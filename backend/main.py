@@ -25,6 +25,7 @@ from fastapi import FastAPI, File, Form, UploadFile, BackgroundTasks, HTTPExcept
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import MutableHeaders
 import mimetypes
 # Lazy import for faster_whisper to avoid numpy compatibility issues at startup
 # from faster_whisper import WhisperModel
@@ -401,6 +402,11 @@ def render_ass_content(words: list, style: dict) -> str:
     return renderer.render()
 
 
+async def render_ass_content_async(words: list, style: dict) -> str:
+    """Render ASS in a worker thread so long transcripts don't block the event loop."""
+    return await asyncio.to_thread(render_ass_content, words, style)
+
+
 
 # Normalize preset fonts to current pool only if missing/invalid so manual choices stick
 for _pid, _pstyle in PRESET_STYLE_MAP.items():
@@ -921,54 +927,93 @@ async def startup_event():
     logger.info("Request logging enabled")
 
 # Request logging middleware
-from starlette.middleware.base import BaseHTTPMiddleware
 import time as _time
 import uuid as _uuid
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = str(_uuid.uuid4())[:8]
-        method = request.method
-        path = request.url.path
-        client_ip = request.client.host if request.client else "unknown"
+# Paths excluded from request logging
+LOG_SKIP_PATHS = frozenset({"/health", "/favicon.ico", "/docs", "/openapi.json"})
+
+class LoggingMiddleware:
+    """Pure ASGI middleware that logs each HTTP request and its outcome."""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
         
         # Skip static and health endpoints
-        if path in ["/health", "/favicon.ico", "/docs", "/openapi.json"]:
-            return await call_next(request)
+        if path in LOG_SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
         
-        start_time = _time.time()
+        request_id = str(_uuid.uuid4())[:8]
+        method = scope["method"]
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        start_ns = _time.perf_counter_ns()
         logger.info(f"[{request_id}] --> {method} {path} | IP: {client_ip}")
         
+        status = 500
+        
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            duration = (_time.time() - start_time) * 1000
-            
-            status = response.status_code
-            status_text = "OK" if status < 300 else "REDIRECT" if status < 400 else "WARN" if status < 500 else "ERROR"
-            logger.info(f"[{request_id}] <-- {method} {path} | {status_text} {status} | {duration:.1f}ms")
-            
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration = (_time.time() - start_time) * 1000
+            duration = (_time.perf_counter_ns() - start_ns) / 1e6
             logger.error(f"[{request_id}] !!! {method} {path} | ERROR: {str(e)[:100]} | {duration:.1f}ms")
             raise
+        
+        duration = (_time.perf_counter_ns() - start_ns) / 1e6
+        status_text = "OK" if status < 300 else "REDIRECT" if status < 400 else "WARN" if status < 500 else "ERROR"
+        logger.info(f"[{request_id}] <-- {method} {path} | {status_text} {status} | {duration:.1f}ms")
 
 app.add_middleware(LoggingMiddleware)
 
-# Security middleware - runs after CORS (middleware order is reversed in starlette)
-@app.middleware("http")
-async def security_middleware(request: Request, call_next):
-    """Global security middleware for headers."""
-    response = await call_next(request)
+# Security headers added to every response
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
+}
+# Pre-encoded once; each response start gets a new header list with these appended
+_SECURITY_RAW_HEADERS = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in SECURITY_HEADERS.items()
+]
+
+class SecurityHeadersMiddleware:
+    """Pure ASGI middleware that appends security headers to every HTTP response."""
     
-    # Add security headers
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+    def __init__(self, app):
+        self.app = app
     
-    return response
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # New list so a reused Response's raw_headers is never mutated
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_RAW_HEADERS]
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
+
+# Security middleware - runs after CORS (middleware order is reversed in starlette)
+app.add_middleware(SecurityHeadersMiddleware)
 
 # Projects static files with CORS
 projects_static = StaticFiles(directory=PROJECTS_DIR)
@@ -1072,14 +1117,28 @@ async def stream_media_options():
         }
     )
 
-@app.middleware("http")
-async def enforce_projects_cors(request: Request, call_next):
-    response = await call_next(request)
-    if request.url.path.startswith("/projects/"):
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers.setdefault("Access-Control-Allow-Headers", "*")
-        response.headers.setdefault("Access-Control-Allow-Methods", "GET, OPTIONS")
-    return response
+class ProjectsCORSMiddleware:
+    """Pure ASGI middleware that forces open CORS headers on /projects/ responses."""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/projects/"):
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["Access-Control-Allow-Origin"] = "*"
+                headers.setdefault("Access-Control-Allow-Headers", "*")
+                headers.setdefault("Access-Control-Allow-Methods", "GET, OPTIONS")
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
+
+app.add_middleware(ProjectsCORSMiddleware)
 
 
 # File upload constraints
@@ -1318,7 +1377,7 @@ async def export_subtitled_video(
 
     ass_path = OUTPUT_DIR / f"subtitles_{uid}.ass"
     
-    ass_content = render_ass_content(words, style)
+    ass_content = await render_ass_content_async(words, style)
         
     ass_path.write_text(ass_content, encoding="utf-8")
 
@@ -1376,7 +1435,7 @@ async def preview_ass(
             if not incoming_style:
                 incoming_style = load_project(project_id).get("config", {}).get("style", {})
         style = build_style(incoming_style)
-        ass_content = render_ass_content(words, style)
+        ass_content = await render_ass_content_async(words, style)
             
         return Response(content=ass_content, media_type="text/plain")
     except Exception as e:
@@ -1939,7 +1998,7 @@ async def preview_pyonfx_effect(
             "effect_config": effect_config,
         }
         
-        ass_content = render_ass_content(words, style)
+        ass_content = await render_ass_content_async(words, style)
         
         return Response(content=ass_content, media_type="text/plain")
     except Exception as e:
@@ -2658,7 +2717,7 @@ async def start_export(
                 f.write(await video.read())
 
         ass_path = OUTPUT_DIR / f"subtitles_{uid}.ass"
-        ass_content = render_ass_content(words, style)
+        ass_content = await render_ass_content_async(words, style)
         ass_path.write_text(ass_content, encoding="utf-8")
 
         out_path = OUTPUT_DIR / f"export_{uid}.mp4"
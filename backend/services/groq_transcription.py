@@ -12,11 +12,19 @@ Groq API Limits:
 - Max file size: 25MB
 - For larger files, audio is split into chunks
 """
+import bisect
+import csv
+import math
 import os
+import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import av
 from groq import Groq
 
 # Initialize Groq client
@@ -26,16 +34,56 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 MAX_CHUNK_SIZE_MB = 20
 MAX_CHUNK_DURATION_SECONDS = 600  # 10 minutes per chunk
 
+# Compression bitrates for 16kHz mono speech
+OPUS_BITRATE = "24k"
+MP3_BITRATE = "64k"
 
+# Chunk cuts snap to a detected pause within SILENCE_SNAP_SECONDS of the target time
+SILENCE_SNAP_SECONDS = 5.0
+SILENCE_NOISE_DB = -30
+SILENCE_MIN_SECONDS = 0.4
+
+# Max parallel chunk uploads (kept low to stay within Groq rate limits)
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "4"))
+
+# Retries per request on rate limits (429), timeouts and 5xx; the SDK backs off
+# exponentially with jitter and honors Retry-After
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "5"))
+
+
+@lru_cache(maxsize=1)
 def get_groq_client() -> Optional[Groq]:
-    """Get Groq client if API key is configured."""
+    """Get the shared Groq client if API key is configured."""
     if not GROQ_API_KEY:
         return None
-    return Groq(api_key=GROQ_API_KEY)
+    return Groq(api_key=GROQ_API_KEY, max_retries=GROQ_MAX_RETRIES)
 
 
 def get_audio_duration(audio_path: str) -> float:
-    """Get duration of audio file in seconds using ffprobe."""
+    """
+    Get duration of audio file in seconds.
+    
+    Reads the container header in-process with PyAV and only spawns
+    ffprobe if the header has no duration. Results are cached per file
+    version, so repeated checks on the same file skip the probe.
+    """
+    try:
+        stat = os.stat(audio_path)
+    except OSError:
+        return 0
+    return _probe_audio_duration(audio_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _probe_audio_duration(audio_path: str, mtime_ns: int, size: int) -> float:
+    """Probe duration; mtime_ns and size only key the cache."""
+    try:
+        with av.open(audio_path) as container:
+            if container.duration is not None:
+                return container.duration / av.time_base
+    except Exception:
+        pass
+    
     try:
         result = subprocess.run(
             [
@@ -51,66 +99,182 @@ def get_audio_duration(audio_path: str) -> float:
         return 0
 
 
-def split_audio_for_groq(audio_path: str, output_dir: str) -> list[tuple[str, float]]:
+def detect_silences(audio_path: str) -> list[float]:
+    """
+    Find pauses in the audio using ffmpeg's silencedetect filter.
+    
+    Returns:
+        Sorted midpoints (seconds) of each detected silence
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-i", audio_path,
+                "-af", f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SECONDS}",
+                "-f", "null", "-"
+            ],
+            capture_output=True, text=True, timeout=300
+        )
+    except Exception:
+        return []
+    
+    starts = [float(m) for m in re.findall(r"silence_start: (-?[\d.]+)", result.stderr)]
+    ends = [float(m) for m in re.findall(r"silence_end: ([\d.]+)", result.stderr)]
+    return [max(0.0, (start + end) / 2) for start, end in zip(starts, ends)]
+
+
+def _nearest_silence(silences: list[float], target: float) -> float:
+    """Snap target to the closest silence within SILENCE_SNAP_SECONDS, else keep it."""
+    i = bisect.bisect_left(silences, target)
+    nearby = [s for s in silences[max(0, i - 1):i + 1] if abs(s - target) <= SILENCE_SNAP_SECONDS]
+    return min(nearby, key=lambda s: abs(s - target)) if nearby else target
+
+
+def split_audio_for_groq(
+    audio_path: str,
+    output_dir: str,
+    normalized: bool = False
+) -> list[tuple[str, float]]:
     """
     Split audio into chunks that fit Groq's 25MB limit.
     
+    Args:
+        audio_path: Path to the audio file
+        output_dir: Directory to write chunks into
+        normalized: True if audio_path is already output of compress_audio_for_groq
+    
     Returns:
         List of (chunk_path, start_time_offset) tuples
     """
     file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-    duration = get_audio_duration(audio_path)
     
     # If file is small enough, no need to split
     if file_size_mb <= MAX_CHUNK_SIZE_MB:
         return [(audio_path, 0.0)]
     
-    # Calculate chunk duration based on file size ratio
-    # Estimate: if file is X times too large, split into X chunks
-    num_chunks = int(file_size_mb / MAX_CHUNK_SIZE_MB) + 1
+    # Encode once to 16kHz mono speech so chunks can be cut without re-encoding
+    if not (normalized or is_compressed_for_groq(audio_path)):
+        normalized_path = os.path.join(output_dir, f"normalized{compressed_audio_suffix()}")
+        audio_path = compress_audio_for_groq(audio_path, normalized_path)
+        file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+        if file_size_mb <= MAX_CHUNK_SIZE_MB:
+            return [(audio_path, 0.0)]
+    
+    duration = get_audio_duration(audio_path)
+    
+    # Calculate chunk duration based on file size ratio; the file is compressed
+    # at a fixed bitrate by now, so size scales linearly with duration
+    num_chunks = math.ceil(file_size_mb / MAX_CHUNK_SIZE_MB)
     chunk_duration = min(duration / num_chunks, MAX_CHUNK_DURATION_SECONDS)
     
+    if chunk_duration <= 0:
+        return []
+    
+    # Move each cut to the nearest pause so words are not split across chunks
+    silences = detect_silences(audio_path)
+    cut_times = []
+    target = chunk_duration
+    while target < duration:
+        cut = _nearest_silence(silences, target)
+        if not cut_times or cut > cut_times[-1]:
+            cut_times.append(cut)
+        target += chunk_duration
+    
+    # Cut all chunks in a single stream-copy pass; the csv segment list
+    # records each chunk's actual start time (cuts land on frame boundaries)
+    segment_list = os.path.join(output_dir, "chunks.csv")
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-i", audio_path,
+            "-f", "segment",
+            "-segment_times", ",".join(f"{t:.3f}" for t in cut_times),
+            "-segment_list", segment_list,
+            "-segment_list_type", "csv",
+            "-reset_timestamps", "1",
+            "-c", "copy",
+            os.path.join(output_dir, f"chunk_%03d{Path(audio_path).suffix}")
+        ],
+        capture_output=True, timeout=300
+    )
+    
     chunks = []
-    current_time = 0.0
-    chunk_index = 0
-    
-    while current_time < duration:
-        chunk_path = os.path.join(output_dir, f"chunk_{chunk_index}.mp3")
-        
-        # Use ffmpeg to extract chunk with re-encoding to ensure smaller size
-        subprocess.run(
-            [
-                "ffmpeg", "-y", "-i", audio_path,
-                "-ss", str(current_time),
-                "-t", str(chunk_duration),
-                "-ar", "16000",  # 16kHz sample rate (good for speech)
-                "-ac", "1",      # Mono
-                "-b:a", "64k",   # Lower bitrate for smaller file
-                chunk_path
-            ],
-            capture_output=True, timeout=300
-        )
-        
-        if os.path.exists(chunk_path) and os.path.getsize(chunk_path) > 0:
-            chunks.append((chunk_path, current_time))
-        
-        current_time += chunk_duration
-        chunk_index += 1
+    if os.path.exists(segment_list):
+        with open(segment_list, newline="") as f:
+            for filename, start_time, _end_time in csv.reader(f):
+                chunk_path = os.path.join(output_dir, filename)
+                if os.path.exists(chunk_path) and os.path.getsize(chunk_path) > 0:
+                    chunks.append((chunk_path, float(start_time)))
     
     return chunks
 
 
+@lru_cache(maxsize=1)
+def has_opus_encoder() -> bool:
+    """Check whether the local ffmpeg build includes libopus."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=30
+        )
+        return "libopus" in result.stdout
+    except Exception:
+        return False
+
+
+def is_compressed_for_groq(audio_path: str) -> bool:
+    """
+    Check if audio is already mono speech at or below the compression bitrate,
+    i.e. compress_audio_for_groq would only re-encode it without shrinking it.
+    """
+    suffix = Path(audio_path).suffix.lower()
+    try:
+        with av.open(audio_path) as container:
+            codec = container.streams.audio[0].codec_context
+            bit_rate = codec.bit_rate or container.bit_rate
+            if not bit_rate or len(codec.layout.channels) != 1:
+                return False
+            if codec.name == "mp3" and suffix == ".mp3":
+                return codec.sample_rate <= 16000 and bit_rate <= _bitrate_bps(MP3_BITRATE)
+            if codec.name == "opus" and suffix in (".ogg", ".opus"):
+                # Opus always decodes at 48kHz, so only the bitrate matters
+                return bit_rate <= _bitrate_bps(OPUS_BITRATE)
+    except Exception:
+        pass
+    return False
+
+
+def _bitrate_bps(bitrate: str) -> int:
+    """Convert an ffmpeg bitrate string like "64k" to bits per second."""
+    return int(bitrate[:-1]) * 1000 if bitrate.endswith("k") else int(bitrate)
+
+
+def compressed_audio_suffix() -> str:
+    """File suffix compress_audio_for_groq should be given (.ogg for Opus, else .mp3)."""
+    return ".ogg" if has_opus_encoder() else ".mp3"
+
+
 def compress_audio_for_groq(audio_path: str, output_path: str) -> str:
     """
     Compress audio to fit within Groq's 25MB limit.
+    Uses Opus for .ogg output paths (about a third of the size of mp3 at the
+    same speech quality), mp3 otherwise.
     Returns path to compressed file.
     """
+    if output_path.endswith(".ogg"):
+        codec_args = [
+            "-c:a", "libopus",
+            "-b:a", OPUS_BITRATE,
+            "-application", "voip",  # Tuned for speech
+        ]
+    else:
+        codec_args = ["-b:a", MP3_BITRATE]
+    
     subprocess.run(
         [
             "ffmpeg", "-y", "-i", audio_path,
             "-ar", "16000",  # 16kHz sample rate
             "-ac", "1",      # Mono
-            "-b:a", "64k",   # 64kbps bitrate
+            *codec_args,
             output_path
         ],
         capture_output=True, timeout=300
@@ -144,7 +308,11 @@ def transcribe_with_groq(
     # If file is too large, compress it first
     if file_size_mb > MAX_CHUNK_SIZE_MB:
         with tempfile.TemporaryDirectory() as temp_dir:
-            compressed_path = os.path.join(temp_dir, "compressed.mp3")
+            # Re-encoding would not shrink already-compressed speech; split it as-is
+            if is_compressed_for_groq(audio_path):
+                return transcribe_chunked(client, audio_path, language, response_format, temp_dir, normalized=True)
+            
+            compressed_path = os.path.join(temp_dir, f"compressed{compressed_audio_suffix()}")
             compress_audio_for_groq(audio_path, compressed_path)
             
             # Check if compression was enough
@@ -152,7 +320,7 @@ def transcribe_with_groq(
             
             if compressed_size_mb > MAX_CHUNK_SIZE_MB:
                 # Need to split into chunks
-                return transcribe_chunked(audio_path, language, response_format, temp_dir)
+                return transcribe_chunked(client, compressed_path, language, response_format, temp_dir, normalized=True)
             
             # Use compressed file
             return transcribe_single_file(client, compressed_path, language, response_format)
@@ -178,67 +346,120 @@ def transcribe_single_file(
     return transcription
 
 
+@dataclass(slots=True)
+class MergedResult:
+    """Chunked transcription merged into the shape of Groq's verbose_json response."""
+    segments: list[dict]
+    words: list[dict]
+    language: str
+    duration: float
+    text: str
+    # Chunks whose upload or merge failed; their span is missing from the transcript
+    failed_chunks: int = 0
+
+
+# Groq returns segments/words as dicts or attribute objects depending on the
+# SDK version; pick the accessor once per list instead of per element
+def _dict_segment_fields(seg: dict) -> tuple:
+    return seg.get("start", 0), seg.get("end", 0), seg.get("text", ""), seg.get("words")
+
+
+def _attr_segment_fields(seg) -> tuple:
+    return getattr(seg, 'start', 0), getattr(seg, 'end', 0), getattr(seg, 'text', ""), getattr(seg, 'words', None)
+
+
+def _dict_word_fields(word: dict) -> tuple:
+    return word.get("start", 0), word.get("end", 0), word.get("word", "")
+
+
+def _attr_word_fields(word) -> tuple:
+    return getattr(word, 'start', 0), getattr(word, 'end', 0), getattr(word, 'word', "")
+
+
+def _segment_fields_for(segments: list):
+    """Return the (start, end, text, words) accessor matching this segment list."""
+    return _dict_segment_fields if isinstance(segments[0], dict) else _attr_segment_fields
+
+
+def _word_fields_for(words: list):
+    """Return the (start, end, word) accessor matching this word list."""
+    return _dict_word_fields if isinstance(words[0], dict) else _attr_word_fields
+
+
+def _append_words(all_words: list[dict], words: list, time_offset: float = 0.0) -> None:
+    """Append words to all_words as {"start", "end", "word"} dicts shifted by time_offset."""
+    word_fields = _word_fields_for(words)
+    for word in words:
+        start, end, text = word_fields(word)
+        all_words.append({
+            "start": start + time_offset,
+            "end": end + time_offset,
+            "word": text,
+        })
+
+
 def transcribe_chunked(
+    client: Groq,
     audio_path: str,
     language: Optional[str],
     response_format: str,
-    temp_dir: str
+    temp_dir: str,
+    normalized: bool = False
 ) -> dict:
     """Transcribe audio by splitting into chunks and merging results."""
-    client = get_groq_client()
-    if not client:
-        raise ValueError("GROQ_API_KEY not configured")
+    chunks = split_audio_for_groq(audio_path, temp_dir, normalized)
+    
+    def transcribe_chunk(chunk: tuple[str, float]):
+        chunk_path, time_offset = chunk
+        try:
+            return transcribe_single_file(client, chunk_path, language, response_format)
+        except Exception as e:
+            # Log but continue with other chunks
+            print(f"Warning: Failed to transcribe chunk at {time_offset}s: {e}")
+            return None
     
-    chunks = split_audio_for_groq(audio_path, temp_dir)
+    # Chunks are independent requests, so upload them concurrently;
+    # map() keeps results in chunk order for the merge below
+    with ThreadPoolExecutor(max_workers=max(1, min(GROQ_MAX_CONCURRENCY, len(chunks)))) as executor:
+        results = list(executor.map(transcribe_chunk, chunks))
     
     all_segments = []
+    all_texts = []
     all_words = []
     total_duration = 0.0
     detected_language = language
+    failed_chunks = 0
     
-    for chunk_path, time_offset in chunks:
+    for (chunk_path, time_offset), result in zip(chunks, results):
+        if result is None:
+            failed_chunks += 1
+            continue
         try:
-            result = transcribe_single_file(client, chunk_path, language, response_format)
-            
             # Get language from first chunk
             if detected_language is None:
                 detected_language = getattr(result, 'language', None)
             
             # Merge segments with time offset
-            if hasattr(result, 'segments') and result.segments:
-                for seg in result.segments:
-                    start = (seg.get("start") if isinstance(seg, dict) else getattr(seg, 'start', 0)) + time_offset
-                    end = (seg.get("end") if isinstance(seg, dict) else getattr(seg, 'end', 0)) + time_offset
-                    text = seg.get("text") if isinstance(seg, dict) else getattr(seg, 'text', "")
+            segments = getattr(result, 'segments', None)
+            if segments:
+                segment_fields = _segment_fields_for(segments)
+                for seg in segments:
+                    start, end, text, seg_words = segment_fields(seg)
                     all_segments.append({
-                        "start": start,
-                        "end": end,
+                        "start": start + time_offset,
+                        "end": end + time_offset,
                         "text": text,
                     })
+                    all_texts.append(text)
                     
                     # Get words from segment
-                    seg_words = seg.get('words', []) if isinstance(seg, dict) else getattr(seg, 'words', [])
-                    for word in (seg_words or []):
-                        w_start = (word.get("start") if isinstance(word, dict) else getattr(word, 'start', 0)) + time_offset
-                        w_end = (word.get("end") if isinstance(word, dict) else getattr(word, 'end', 0)) + time_offset
-                        w_text = word.get("word") if isinstance(word, dict) else getattr(word, 'word', "")
-                        all_words.append({
-                            "start": w_start,
-                            "end": w_end,
-                            "word": w_text,
-                        })
+                    if seg_words:
+                        _append_words(all_words, seg_words, time_offset)
             
             # Also check for top-level words
-            if hasattr(result, 'words') and result.words:
-                for word in result.words:
-                    w_start = (word.get("start") if isinstance(word, dict) else getattr(word, 'start', 0)) + time_offset
-                    w_end = (word.get("end") if isinstance(word, dict) else getattr(word, 'end', 0)) + time_offset
-                    w_text = word.get("word") if isinstance(word, dict) else getattr(word, 'word', "")
-                    all_words.append({
-                        "start": w_start,
-                        "end": w_end,
-                        "word": w_text,
-                    })
+            words = getattr(result, 'words', None)
+            if words:
+                _append_words(all_words, words, time_offset)
             
             # Update total duration
             chunk_duration = getattr(result, 'duration', 0)
@@ -246,18 +467,45 @@ def transcribe_chunked(
             
         except Exception as e:
             # Log but continue with other chunks
-            print(f"Warning: Failed to transcribe chunk at {time_offset}s: {e}")
+            print(f"Warning: Failed to merge chunk at {time_offset}s: {e}")
+            failed_chunks += 1
     
     # Create a result object that mimics Groq's response
-    class MergedResult:
-        def __init__(self):
-            self.segments = all_segments
-            self.words = all_words
-            self.language = detected_language or 'unknown'
-            self.duration = total_duration
-            self.text = " ".join(seg.get("text", "") for seg in all_segments)
-    
-    return MergedResult()
+    return MergedResult(
+        segments=all_segments,
+        words=all_words,
+        language=detected_language or 'unknown',
+        duration=total_duration,
+        text=" ".join(all_texts),
+        failed_chunks=failed_chunks,
+    )
+
+
+class _PartialTranscription(Exception):
+    """Carries a chunked result with failed chunks past lru_cache, which never stores exceptions."""
+
+    def __init__(self, result: MergedResult):
+        super().__init__(f"{result.failed_chunks} chunk(s) failed")
+        self.result = result
+
+
+def _transcribe_verbose(audio_path: str, language: Optional[str]):
+    """verbose_json transcription shared by the segment and word views of a file."""
+    stat = os.stat(audio_path)
+    try:
+        return _transcribe_verbose_cached(audio_path, stat.st_mtime_ns, stat.st_size, language)
+    except _PartialTranscription as partial:
+        return partial.result
+
+
+@lru_cache(maxsize=8)
+def _transcribe_verbose_cached(audio_path: str, mtime_ns: int, size: int, language: Optional[str]):
+    """mtime_ns and size only key the cache, so an edited file is transcribed again."""
+    result = transcribe_with_groq(audio_path, language, "verbose_json")
+    if getattr(result, "failed_chunks", 0):
+        # Don't cache a transcript with gaps; the next call retries the failed chunks
+        raise _PartialTranscription(result)
+    return result
 
 
 def transcribe_to_segments(
@@ -272,15 +520,18 @@ def transcribe_to_segments(
         - segments: List of {"start": float, "end": float, "text": str}
         - info: {"language": str, "duration": float}
     """
-    result = transcribe_with_groq(audio_path, language, "verbose_json")
+    result = _transcribe_verbose(audio_path, language)
     
     segments = []
-    if hasattr(result, 'segments') and result.segments:
-        for seg in result.segments:
+    result_segments = getattr(result, 'segments', None)
+    if result_segments:
+        segment_fields = _segment_fields_for(result_segments)
+        for seg in result_segments:
+            start, end, text, _words = segment_fields(seg)
             segments.append({
-                "start": seg.get("start", seg.start) if hasattr(seg, 'start') else seg.get("start", 0),
-                "end": seg.get("end", seg.end) if hasattr(seg, 'end') else seg.get("end", 0),
-                "text": seg.get("text", seg.text) if hasattr(seg, 'text') else seg.get("text", ""),
+                "start": start,
+                "end": end,
+                "text": text,
             })
     
     info = {
@@ -303,26 +554,20 @@ def transcribe_to_words(
         - words: List of {"start": float, "end": float, "word": str}
         - info: {"language": str, "duration": float}
     """
-    result = transcribe_with_groq(audio_path, language, "verbose_json")
+    result = _transcribe_verbose(audio_path, language)
     
     words = []
-    if hasattr(result, 'words') and result.words:
-        for word in result.words:
-            words.append({
-                "start": word.get("start", getattr(word, 'start', 0)),
-                "end": word.get("end", getattr(word, 'end', 0)),
-                "word": word.get("word", getattr(word, 'word', "")),
-            })
-    elif hasattr(result, 'segments') and result.segments:
+    result_words = getattr(result, 'words', None)
+    result_segments = getattr(result, 'segments', None)
+    if result_words:
+        _append_words(words, result_words)
+    elif result_segments:
         # Fallback: Extract words from segments if word-level not available
-        for seg in result.segments:
-            seg_words = getattr(seg, 'words', None) or seg.get('words', [])
-            for word in seg_words:
-                words.append({
-                    "start": word.get("start", getattr(word, 'start', 0)),
-                    "end": word.get("end", getattr(word, 'end', 0)),
-                    "word": word.get("word", getattr(word, 'word', "")),
-                })
+        segment_fields = _segment_fields_for(result_segments)
+        for seg in result_segments:
+            seg_words = segment_fields(seg)[3]
+            if seg_words:
+                _append_words(words, seg_words)
     
     info = {
         "language": getattr(result, 'language', language or 'unknown'),
@@ -947,6 +947,8 @@ class PyonFXRenderer(PyonFXRenderMixin):
     """
     Renderer for PyonFX effects within ASS subtitle format
     """
+
+    __slots__ = ("words", "style", "effect_type", "effect_config", "effect")
     
     EFFECTS = {
         "bulge": BulgeEffect,
@@ -1066,6 +1068,20 @@ class PyonFXRenderer(PyonFXRenderMixin):
         "fade_word": FadeWordEffect,
         "slide_in_karaoke": SlideInKaraokeEffect,
     }
+
+    # Constructor arguments per effect as (effect_config key, default);
+    # effects not listed here are built without arguments.
+    EFFECT_ARGS = {
+        "bulge": (("intensity", 1.5),),
+        "shake": (("intensity", 8.0), ("frequency", 15.0)),
+        "wave": (("amplitude", 25.0), ("wavelength", 80.0)),
+        "chromatic": (("shift_amount", 3.0),),
+        "fire_storm": (("particle_count", 12),),
+        "bubble_floral": (("bubble_count", 8),),
+        "earthquake_shake": (("angle_range", 5), ("step_ms", 40)),
+        "horror_creepy": (("step_ms", 50),),
+        "pulse": (("ring_count", 3),),
+    }
     
     def __init__(self, words: List[Dict[str, Any]], style: Dict[str, Any]):
         """
@@ -1080,81 +1096,8 @@ class PyonFXRenderer(PyonFXRenderMixin):
         
         # Initialize effect
         effect_class = self.EFFECTS.get(self.effect_type, BulgeEffect)
-        if self.effect_type == "bulge":
-            self.effect = effect_class(self.effect_config.get("intensity", 1.5))
-        elif self.effect_type == "shake":
-            self.effect = effect_class(
-                self.effect_config.get("intensity", 8.0),
-                self.effect_config.get("frequency", 15.0)
-            )
-        elif self.effect_type == "wave":
-            self.effect = effect_class(
-                self.effect_config.get("amplitude", 25.0),
-                self.effect_config.get("wavelength", 80.0)
-            )
-        elif self.effect_type == "chromatic":
-            self.effect = effect_class(self.effect_config.get("shift_amount", 3.0))
-        elif self.effect_type == "fire_storm":
-            self.effect = effect_class(self.effect_config.get("particle_count", 12))
-        elif self.effect_type == "cyber_glitch":
-            self.effect = effect_class()
-        elif self.effect_type == "bubble_floral":
-            self.effect = effect_class(self.effect_config.get("bubble_count", 8))
-        elif self.effect_type == "thunder_strike":
-            self.effect = effect_class()
-        elif self.effect_type == "rainbow_wave":
-            self.effect = effect_class()
-        elif self.effect_type == "earthquake_shake":
-            self.effect = effect_class(
-                self.effect_config.get("angle_range", 5),
-                self.effect_config.get("step_ms", 40),
-            )
-        elif self.effect_type == "horror_creepy":
-            self.effect = effect_class(self.effect_config.get("step_ms", 50))
-        elif self.effect_type == "luxury_gold":
-            self.effect = effect_class()
-        elif self.effect_type == "comic_book":
-            self.effect = effect_class()
-        elif self.effect_type == "pulse":
-            self.effect = effect_class(self.effect_config.get("ring_count", 3))
-        elif self.effect_type == "colorful":
-            self.effect = effect_class()
-        elif self.effect_type == "ghost_star":
-            self.effect = effect_class()
-        elif self.effect_type == "matrix_rain":
-            self.effect = effect_class()
-        elif self.effect_type == "electric_shock":
-            self.effect = effect_class()
-        elif self.effect_type == "smoke_trail":
-            self.effect = effect_class()
-        elif self.effect_type == "pixel_glitch":
-            self.effect = effect_class()
-        elif self.effect_type == "neon_sign":
-            self.effect = effect_class()
-        elif self.effect_type == "fade_in_out":
-            self.effect = effect_class()
-        elif self.effect_type == "slide_up":
-            self.effect = effect_class()
-        elif self.effect_type == "zoom_burst":
-            self.effect = effect_class()
-        elif self.effect_type == "bounce_in":
-            self.effect = effect_class()
-        elif self.effect_type == "tiktok_yellow_box":
-            self.effect = effect_class()
-        elif self.effect_type == "falling_heart":
-            self.effect = effect_class()
-        elif self.effect_type == "thunder_storm":
-            self.effect = effect_class()
-        elif self.effect_type == "ice_crystal":
-            self.effect = effect_class()
-        elif self.effect_type == "cosmic_stars":
-            self.effect = effect_class()
-        elif self.effect_type == "ocean_wave":
-            self.effect = effect_class()
-        elif self.effect_type == "butterfly_dance":
-            self.effect = effect_class()
-        else:
-            self.effect = effect_class()
+        args = [self.effect_config.get(key, default) for key, default in self.EFFECT_ARGS.get(self.effect_type, ())]
+        self.effect = effect_class(*args)
     
     def render(self) -> str:
         """Render all words with PyonFX effects applied"""
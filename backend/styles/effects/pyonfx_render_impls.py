@@ -1,17 +1,115 @@
+from functools import lru_cache
 from typing import Any, List
 import math
 import random
 import os
+import numpy as np
 from ..utils import hex_to_ass, get_text_width, get_text_metrics, get_font_path, estimate_text_width_heuristic, calculate_optimal_font_size, calculate_optimal_font_size_for_groups
 
+# Trig lookup tables for integer-degree angles in [-360, 720), indexed by angle + _DEG_OFFSET.
+_DEG_OFFSET = 360
+_COS_DEG = tuple(math.cos(math.radians(a)) for a in range(-_DEG_OFFSET, 720))
+_SIN_DEG = tuple(math.sin(math.radians(a)) for a in range(-_DEG_OFFSET, 720))
+
+# Word-invariant particle geometry, offsets relative to the text center.
+# Butterfly flight path: (start_x, start_y, end_x, end_y) per butterfly.
+_BUTTERFLY_PATH = tuple(
+    (
+        int(math.cos(math.radians(i / 18 * 360 * 2)) * 100),
+        int(math.sin(math.radians(i / 18 * 360 * 2) * 2) * 50),
+        int(math.cos(math.radians((i / 18 + 0.5) * 360 * 2)) * 100),
+        int(math.sin(math.radians((i / 18 + 0.5) * 360 * 2) * 2) * 50),
+    )
+    for i in range(18)
+)
+# Ocean foam ring: (cos, sin, vertical ripple) per droplet; radius is drawn per word.
+_OCEAN_RING = tuple(
+    (
+        math.cos(math.radians(i * 360 / 40)),
+        math.sin(math.radians(i * 360 / 40)),
+        int(math.sin(math.radians(i * 360 / 40) * 3) * 20),
+    )
+    for i in range(40)
+)
+_OCEAN_WAVE_OFFSETS = tuple(int(math.sin((i / 5) * math.pi * 2) * 10) for i in range(5))
+# Ice shards: (angle, x, y) for the 8 shards bursting at radius 60.
+_ICE_SHARDS = tuple(
+    (i * 45, int(math.cos(math.radians(i * 45)) * 60), int(math.sin(math.radians(i * 45)) * 60))
+    for i in range(8)
+)
+
+# Random-pick pools, hoisted so particle loops don't rebuild a literal per draw.
+# Colors are already in ASS form, so they are used without hex_to_ass.
+_BUBBLE_TILTS = (-15, 15)
+_GHOST_STAR_COLORS = ("&HFFFFFF&", "&HFFFF00&", "&H00FFFF&")
+_HEART_SPINS = (-500, 500, -700, 700)
+_HEART_COLORS = ("&HFF69B4&", "&HFF1493&", "&HFF00FF&")
+_COSMIC_ORBIT_TURNS = (360, -360, 720)
+_COSMIC_STAR_COLORS = ("&HFFFFFF&", "&HFFFF00&", "&HFF00FF&", "&H00FFFF&")
+_COSMIC_DUST_COLORS = ("&HFFFFFF&", "&HFFCCFF&", "&HCCFFFF&")
+_COSMIC_NEBULA_COLORS = ("&HFF00FF&", "&HFF0088&", "&H8800FF&")
+_BUTTERFLY_COLORS = ("&HFF69B4&", "&HFF00FF&", "&H00FFFF&", "&HFFFF00&")
+_PETAL_COLORS = ("&HFFC0CB&", "&HFF69B4&", "&HFFFFFF&")
+_PHOENIX_COLORS = ("&H00FF8800&", "&H00FFAA00&", "&H00FF4500&")
+
+# Default animation tag runs for the static renderers.
+_THUNDER_FLASH = "\\t(0,50,\\3c&HFFFFFF&)\\t(50,100,\\3c&H000000&)\\t(100,150,\\3c&HFFFFFF&)\\t(150,200,\\3c&H000000&)"
+_GOLD_SHINE = "\\t(0,100,\\1c&HFFFFFF&)\\t(100,300,\\1c&H00D7FF&)"
+# Neon flicker blink for each 100 ms slot of a word's first second.
+_NEON_FLICKER = tuple(f"\\t({t},{t+50},\\alpha&HFF&)\\t({t+50},{t+100},\\alpha&H00&)" for t in range(0, 1000, 100))
+_BOUNCE_IN = "\\t(0,150,\\fscx120\\fscy120)\\t(150,250,\\fscx95\\fscy95)\\t(250,350,\\fscx105\\fscy105)\\t(350,400,\\fscx100\\fscy100)"
+
+# ASS vector drawings (\p1) shared by the particle renderers.
+_STAR_SHAPE = "m 30 23 b 24 23 24 33 30 33 b 36 33 37 23 30 23 m 35 27 l 61 28 l 35 29 m 26 27 l 0 28 l 26 29"
+_SPARKLE_SHAPE = "m 0 -20 l 5 -5 20 0 5 5 0 20 -5 5 -20 0 -5 -5"
+_BUBBLE_SHAPE = "m 0 -15 b -21 -15 -21 16 0 16 b 23 16 23 -15 0 -15"
+_OCEAN_BUBBLE_SHAPE = (
+    "m 0 16 b 0 16 0 16 0 16 b 0 16 0 16 0 16 b 0 16 0 16 0 16 b 0 16 0 16 0 16 "
+    "b 0 0 20 0 20 16 b 20 16 20 16 20 16 b 20 33 0 33 0 16"
+)
+_LIGHTNING_SHAPE = "m 0 0 l 5 20 l -3 20 l 8 40 l -10 25 l 0 25"
+_SMOKE_SHAPE = "m 0 0 b 10 -5 20 -5 30 0 b 20 5 10 5 0 0"
+_HEART_SHAPE = "m 18 40 b 23 29 35 27 35 16 b 36 8 23 0 18 11 b 14 0 0 8 1 16 b 1 27 14 29 18 40"
+_SNOWFLAKE_SHAPE = "m 0 -15 l 0 15 m -15 0 l 15 0 m -10 -10 l 10 10 m -10 10 l 10 -10"
+_SHARD_SHAPE = "m 0 0 l 3 -25 l 6 0"
+_BUTTERFLY_SHAPE = "m 10 15 b 5 10 0 5 0 0 b 0 5 5 10 10 15 m 10 15 b 15 10 20 5 20 0 b 20 5 15 10 10 15"
+_PETAL_SHAPE = "m 0 0 b 10 -5 20 -5 30 0 b 20 5 10 5 0 0"
+_FLAME_SHAPE = "m 0 0 b 5 -10 10 -10 15 0 b 10 15 5 15 0 0"
+
+# Draws that are not batched go through a module-local generator with its bound
+# methods cached as module names, skipping random's module attribute lookups.
+_RANDOM = random.Random()
+_randint = _RANDOM.randint
+_choice = _RANDOM.choice
+_uniform = _RANDOM.uniform
+_random = _RANDOM.random
+
+# Particle-heavy renderers draw all of a render's random values in one vectorized
+# call instead of several random.randint calls per particle.
+_RNG = np.random.default_rng()
+
+def _randint_rows(n_rows: int, bounds: tuple) -> list:
+    """n_rows rows of randint(lo, hi) draws (inclusive), one column per (lo, hi) in bounds."""
+    lows, highs = zip(*bounds)
+    return _RNG.integers(lows, [high + 1 for high in highs], size=(n_rows, len(bounds))).tolist()
+
+def _unit_draws(n: int) -> list:
+    """n uniform floats in [0, 1); int(u * (span + 1)) gives randint(0, span) for per-word spans."""
+    return _RNG.random(n).tolist()
+
+@lru_cache(maxsize=1024)
+def _color_cycle_tags(ass_colors: tuple, dur: int) -> str:
+    """\\1c transforms stepping through ass_colors in equal slices of dur (memoized, words repeat durations)."""
+    step = max(1, dur // max(1, len(ass_colors)))
+    return "".join([f"\\t({i * step},{min(dur, (i + 1) * step)},\\1c{color})" for i, color in enumerate(ass_colors)])
+
 def _render_fire_storm(self) -> str:
     """Port of FireStormRenderer using PyonFX pipeline."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     particle_count = int(self.effect_config.get("particle_count", getattr(self.effect, "particle_count", 12)))
     colors = self.effect_config.get("colors", ["&H0000FF&", "&H00FFFF&", "&HFFFFFF&"])
-    # Star path from original preset
-    star_shape = "m 30 23 b 24 23 24 33 30 33 b 36 33 37 23 30 23 m 35 27 l 61 28 l 35 29 m 26 27 l 0 28 l 26 29"
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -22,27 +120,27 @@ def _render_fire_storm(self) -> str:
         # Base glowing text
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(100,100)\\blur5\\t(0,{duration},\\fscx110\\fscy110\\blur10)}}{safe_text}"
+            f"{{{pos_tag}\\fad(100,100)\\blur5\\t(0,{duration},\\fscx110\\fscy110\\blur10)}}{safe_text}"
         )
 
         # Particles
         for _ in range(particle_count):
-            angle = math.radians(random.uniform(0, 360))
-            speed = random.uniform(
+            angle = math.radians(_uniform(0, 360))
+            speed = _uniform(
                 float(self.effect_config.get("min_speed", 30.0)),
                 float(self.effect_config.get("max_speed", 120.0)),
             )
-            sx = cx + random.uniform(-40, 40)
-            sy = cy + random.uniform(-10, 10)
+            sx = cx + _uniform(-40, 40)
+            sy = cy + _uniform(-10, 10)
             ex = sx + math.cos(angle) * speed
             ey = sy + math.sin(angle) * speed
-            p_start = start_ms + random.randint(0, max(0, duration - 200))
-            p_end = p_start + random.randint(300, 600)
-            color = random.choice(colors)
+            p_start = start_ms + _randint(0, max(0, duration - 200))
+            p_end = p_start + _randint(300, 600)
+            color = _choice(colors)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({int(sx)},{int(sy)},{int(ex)},{int(ey)})\\fad(0,200)\\blur2\\1c{color}\\bord0\\p1\\t(\\fscx0\\fscy0)}}"
-                f"{star_shape}{{\\p0}}"
+                f"{_STAR_SHAPE}{{\\p0}}"
             )
 
     return "\n".join(lines)
@@ -51,6 +149,7 @@ def _render_cyber_glitch(self) -> str:
     """Port of CyberGlitchRenderer with configurable jitter/scale."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
 
     offset_px = int(self.effect_config.get("offset_px", 3))
     jitter_min = int(self.effect_config.get("jitter_min_ms", 40))
@@ -61,32 +160,34 @@ def _render_cyber_glitch(self) -> str:
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
         # Blue channel (left -> right)
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx - offset_px},{cy})\\1c&H0000FF&\\t(\\pos({cx + offset_px},{cy}))}}{safe_text}"
         )
         # Red channel (right -> left)
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx + offset_px},{cy})\\1c&HFF0000&\\t(\\pos({cx - offset_px},{cy}))}}{safe_text}"
         )
 
         # Main jitter line
-        jitter_tags = ""
+        jitter_parts = []
         curr = 0
         while curr < dur:
-            step = random.randint(jitter_min, max(jitter_min, jitter_max))
-            sc = random.randint(scale_min, max(scale_min, scale_max))
-            jitter_tags += f"\\t({curr},{curr + step},\\fscx{sc}\\fscy{sc})"
+            step = _randint(jitter_min, max(jitter_min, jitter_max))
+            sc = _randint(scale_min, max(scale_min, scale_max))
+            jitter_parts.append(f"\\t({curr},{curr + step},\\fscx{sc}\\fscy{sc})")
             curr += step
+        jitter_tags = "".join(jitter_parts)
 
         lines.append(
-            f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy}){jitter_tags}}}{safe_text}"
+            f"Dialogue: 2,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}{jitter_tags}}}{safe_text}"
         )
 
     return "\n".join(lines)
@@ -96,12 +197,18 @@ def _render_bubble_floral(self) -> str:
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
 
-    bubble_shape = "m 0 -15 b -21 -15 -21 16 0 16 b 23 16 23 -15 0 -15"
     bubble_count = int(self.effect_config.get("bubble_count", getattr(self.effect, "bubble_count", 8)))
     drift_y_min = int(self.effect_config.get("drift_y_min", 100))
     drift_y_max = int(self.effect_config.get("drift_y_max", 200))
     bubble_size_min = int(self.effect_config.get("bubble_size_min", 10))
     bubble_size_max = int(self.effect_config.get("bubble_size_max", 30))
+    if not self.words:
+        return "\n".join(lines)
+    n_bubbles = len(self.words) * bubble_count
+    draws = iter(_randint_rows(n_bubbles, (
+        (-50, 50), (-100, 50), (drift_y_min, drift_y_max), (800, 1200), (bubble_size_min, bubble_size_max),
+    )))
+    delays = iter(_unit_draws(n_bubbles))
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -109,7 +216,7 @@ def _render_bubble_floral(self) -> str:
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
-        rotation = random.choice([-15, 15])
+        rotation = _choice(_BUBBLE_TILTS)
         # Main text float-in
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
@@ -120,16 +227,16 @@ def _render_bubble_floral(self) -> str:
 
         # Bubbles
         for _ in range(bubble_count):
-            bx = cx + random.randint(-50, 50)
-            by = cy + random.randint(-100, 50)
-            ey = by - random.randint(drift_y_min, drift_y_max)
-            b_start = start_ms + random.randint(0, dur // 2)
-            b_end = b_start + random.randint(800, 1200)
-            size = random.randint(bubble_size_min, bubble_size_max)
+            dx, dy, drift, life, size = next(draws)
+            bx = cx + dx
+            by = cy + dy
+            ey = by - drift
+            b_start = start_ms + int(next(delays) * (dur // 2 + 1))
+            b_end = b_start + life
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(b_start)},{self._ms_to_timestamp(b_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({bx},{by},{bx},{ey})\\fscx{size}\\fscy{size}\\1c&HFFFFFF&\\3c&HFFFFFF&\\blur5\\fad(100,200)\\p1}}"
-                f"{bubble_shape}{{\\p0}}"
+                f"{_BUBBLE_SHAPE}{{\\p0}}"
             )
 
     return "\n".join(lines)
@@ -138,37 +245,26 @@ def _render_thunder_strike(self) -> str:
     """Port of ThunderStrikeRenderer: flashing outline."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    flash = self.effect_config.get(
-        "flash_tags",
-        "\\t(0,50,\\3c&HFFFFFF&)\\t(50,100,\\3c&H000000&)\\t(100,150,\\3c&HFFFFFF&)\\t(150,200,\\3c&H000000&)",
-    )
+    pos_tag = f"\\an5\\pos({cx},{cy})"
+    flash = self.effect_config.get("flash_tags", _THUNDER_FLASH)
 
+    # Everything after the timestamps is the same for every word
+    body = f",Default,,0,0,0,,{{{pos_tag}\\fad(50,50){flash}\\fscx110\\fscy110}}"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(50,50){flash}\\fscx110\\fscy110}}{safe_text}"
-        )
+        lines.append(f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)}{body}{safe_text}")
     return "\n".join(lines)
 
 def _render_rainbow_wave(self) -> str:
     """Port of RainbowWaveRenderer: simple color cycle."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     colors = self.effect_config.get("colors", ["&H00FF00&", "&HFF0000&", "&H0000FF&"])
-    # Build transform sequence evenly over duration thirds
-    def build_rainbow(dur: int) -> str:
-        if not colors:
-            return ""
-        step = max(1, dur // max(1, len(colors)))
-        tags = ""
-        for i, col in enumerate(colors):
-            t_start = i * step
-            t_end = min(dur, (i + 1) * step)
-            tags += f"\\t({t_start},{t_end},\\1c{hex_to_ass(col)})"
-        return tags
+    # Transform sequence evenly over the word duration
+    ass_colors = tuple(hex_to_ass(col) for col in colors)
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -177,7 +273,7 @@ def _render_rainbow_wave(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(50,50){build_rainbow(dur)}}}{safe_text}"
+            f"{{{pos_tag}\\fad(50,50){_color_cycle_tags(ass_colors, dur)}}}{safe_text}"
         )
     return "\n".join(lines)
 
@@ -185,6 +281,7 @@ def _render_earthquake_shake(self) -> str:
     """Port of EarthquakeShakeRenderer: rotation jitter."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     angle_range = int(self.effect_config.get("angle_range", getattr(self.effect, "angle_range", 5)))
     step_ms = int(self.effect_config.get("step_ms", getattr(self.effect, "step_ms", 40)))
 
@@ -194,17 +291,18 @@ def _render_earthquake_shake(self) -> str:
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
-        shake = ""
+        shake_parts = []
         curr = 0
         while curr < dur:
-            angle = random.randint(-angle_range, angle_range)
+            angle = _randint(-angle_range, angle_range)
             step = step_ms
-            shake += f"\\t({curr},{curr + step},\\frz{angle})"
+            shake_parts.append(f"\\t({curr},{curr + step},\\frz{angle})")
             curr += step
+        shake = "".join(shake_parts)
 
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy}){shake}}}{safe_text}"
+            f"{{{pos_tag}{shake}}}{safe_text}"
         )
     return "\n".join(lines)
 
@@ -212,6 +310,7 @@ def _render_horror_creepy(self) -> str:
     """Port of HorrorCreepyRenderer: jitter with blur pulses."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     step_ms = int(self.effect_config.get("step_ms", getattr(self.effect, "step_ms", 50)))
 
     for word in self.words:
@@ -220,19 +319,20 @@ def _render_horror_creepy(self) -> str:
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
-        shake = ""
+        shake_parts = []
         curr = 0
         while curr < dur:
-            ox = random.randint(-2, 2)
-            oy = random.randint(-2, 2)
-            fscx = random.randint(95, 105)
-            fscy = random.randint(95, 105)
-            shake += f"\\t({curr},{curr + step_ms},\\fscx{fscx}\\fscy{fscy}\\pos({cx + ox},{cy + oy}))"
+            ox = _randint(-2, 2)
+            oy = _randint(-2, 2)
+            fscx = _randint(95, 105)
+            fscy = _randint(95, 105)
+            shake_parts.append(f"\\t({curr},{curr + step_ms},\\fscx{fscx}\\fscy{fscy}\\pos({cx + ox},{cy + oy}))")
             curr += step_ms
+        shake = "".join(shake_parts)
 
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur3\\t(0,200,\\blur0){shake}}}{safe_text}"
+            f"{{{pos_tag}\\blur3\\t(0,200,\\blur0){shake}}}{safe_text}"
         )
     return "\n".join(lines)
 
@@ -240,34 +340,32 @@ def _render_luxury_gold(self) -> str:
     """Port of LuxuryGoldRenderer: simple shine color transform."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    shine = self.effect_config.get(
-        "shine_tags",
-        "\\t(0,100,\\1c&HFFFFFF&)\\t(100,300,\\1c&H00D7FF&)",
-    )
+    pos_tag = f"\\an5\\pos({cx},{cy})"
+    shine = self.effect_config.get("shine_tags", _GOLD_SHINE)
 
+    # Everything after the timestamps is the same for every word
+    body = f",Default,,0,0,0,,{{{pos_tag}\\fad(100,100){shine}}}"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(100,100){shine}}}{safe_text}"
-        )
+        lines.append(f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)}{body}{safe_text}")
     return "\n".join(lines)
 
 def _render_comic_book(self) -> str:
     """Port of ComicBookRenderer: rotate and bounce scale."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        rot = random.randint(-5, 5)
+        rot = _randint(-5, 5)
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\frz{rot}\\fscx50\\fscy50"
+            f"{{{pos_tag}\\frz{rot}\\fscx50\\fscy50"
             f"\\t(0,100,\\fscx110\\fscy110)\\t(100,150,\\fscx100\\fscy100)}}{safe_text}"
         )
     return "\n".join(lines)
@@ -276,8 +374,8 @@ def _render_pulse(self) -> str:
     """Port of PulseRenderer: pulse + expanding rings."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     ring_count = int(self.effect_config.get("ring_count", getattr(self.effect, "ring_count", 3)))
-    ring_shape = "m 0 -15 b -21 -15 -21 16 0 16 b 23 16 23 -15 0 -15"
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -289,7 +387,7 @@ def _render_pulse(self) -> str:
         pulse_tags = f"\\t(0,{mid},\\fscx115\\fscy115\\blur10)\\t({mid},{dur},\\fscx100\\fscy100\\blur2)"
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(50,50){pulse_tags}}}{safe_text}"
+            f"{{{pos_tag}\\fad(50,50){pulse_tags}}}{safe_text}"
         )
 
         for i in range(ring_count):
@@ -299,8 +397,8 @@ def _render_pulse(self) -> str:
             scale_end = 350 + i * 50
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(ring_start)},{self._ms_to_timestamp(ring_end)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\1a&HFF&\\3c&HFFFFFF&\\bord2\\fscx{scale_start}\\fscy{scale_start}"
-                f"\\t(\\fscx{scale_end}\\fscy{scale_end}\\alpha&HFF&)\\p1}}{ring_shape}{{\\p0}}"
+                f"{{{pos_tag}\\1a&HFF&\\3c&HFFFFFF&\\bord2\\fscx{scale_start}\\fscy{scale_start}"
+                f"\\t(\\fscx{scale_end}\\fscy{scale_end}\\alpha&HFF&)\\p1}}{_BUBBLE_SHAPE}{{\\p0}}"
             )
     return "\n".join(lines)
 
@@ -308,37 +406,44 @@ def _render_colorful(self) -> str:
     """Port of ColorfulRenderer with color cycle + particles."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     colors = self.effect_config.get(
         "colors",
         ["&H0000FF&", "&H00FFFF&", "&H00FF00&", "&HFFFF00&", "&HFF0000&", "&HFF00FF&"],
     )
+    if not self.words:
+        return "\n".join(lines)
+    ass_colors = tuple(hex_to_ass(color) for color in colors)
+    # An empty palette still renders the text, just without particles to color
+    particles_per_word = 10 if ass_colors else 0
+    if particles_per_word:
+        n_particles = len(self.words) * particles_per_word
+        draws = iter(_randint_rows(n_particles, (
+            (-60, 60), (-40, 40), (-100, 100), (-100, 100), (400, 800), (0, len(colors) - 1),
+        )))
+        delays = iter(_unit_draws(n_particles))
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        step = max(1, dur // max(1, len(colors)))
-
-        color_transforms = ""
-        for i, color in enumerate(colors):
-            t_start = i * step
-            t_end = min(dur, (i + 1) * step)
-            color_transforms += f"\\t({t_start},{t_end},\\1c{hex_to_ass(color)})"
+        color_transforms = _color_cycle_tags(ass_colors, dur)
 
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx110\\fscy110\\blur3{color_transforms}\\fad(100,100)}}{safe_text}"
+            f"{{{pos_tag}\\fscx110\\fscy110\\blur3{color_transforms}\\fad(100,100)}}{safe_text}"
         )
 
-        for _ in range(10):
-            px = cx + random.randint(-60, 60)
-            py = cy + random.randint(-40, 40)
-            ex = px + random.randint(-100, 100)
-            ey = py + random.randint(-100, 100)
-            p_start = start_ms + random.randint(0, dur // 2)
-            p_end = p_start + random.randint(400, 800)
-            p_color = hex_to_ass(random.choice(colors))
+        for _ in range(particles_per_word):
+            dx, dy, mx, my, life, color_idx = next(draws)
+            px = cx + dx
+            py = cy + dy
+            ex = px + mx
+            ey = py + my
+            p_start = start_ms + int(next(delays) * (dur // 2 + 1))
+            p_end = p_start + life
+            p_color = ass_colors[color_idx]
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({px},{py},{ex},{ey})\\1c{p_color}\\fscx15\\fscy15\\blur4\\fad(0,200)\\p1}}"
@@ -350,7 +455,18 @@ def _render_ghost_star(self) -> str:
     """Port of GhostStarRenderer with orbiting stars."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    star_shape = "m 30 23 b 24 23 24 33 30 33 b 36 33 37 23 30 23 m 35 27 l 61 28 l 35 29 m 26 27 l 0 28 l 26 29"
+    pos_tag = f"\\an5\\pos({cx},{cy})"
+    if not self.words:
+        return "\n".join(lines)
+    n_stars = len(self.words) * 12
+    draws = iter(_randint_rows(n_stars, (
+        (-100, 100), (-80, 80), (800, 1200), (15, 35), (0, len(_GHOST_STAR_COLORS) - 1),
+    )))
+    delays = iter(_unit_draws(n_stars))
+    # Flight vector per star: random direction, 80-150px
+    angles = np.radians(_RNG.uniform(0, 360, n_stars))
+    distances = _RNG.uniform(80, 150, n_stars)
+    flights = iter(zip((np.cos(angles) * distances).tolist(), (np.sin(angles) * distances).tolist()))
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -360,24 +476,23 @@ def _render_ghost_star(self) -> str:
 
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur8\\fscx105\\fscy105\\t(\\blur2\\fscx100\\fscy100)\\fad(150,150)}}{safe_text}"
+            f"{{{pos_tag}\\blur8\\fscx105\\fscy105\\t(\\blur2\\fscx100\\fscy100)\\fad(150,150)}}{safe_text}"
         )
 
         for _ in range(12):
-            sx = cx + random.randint(-100, 100)
-            sy = cy + random.randint(-80, 80)
-            angle = random.uniform(0, 360)
-            distance = random.uniform(80, 150)
-            ex = sx + math.cos(math.radians(angle)) * distance
-            ey = sy + math.sin(math.radians(angle)) * distance
-            s_start = start_ms + random.randint(0, dur)
-            s_end = s_start + random.randint(800, 1200)
-            size = random.randint(15, 35)
-            star_color = hex_to_ass(random.choice(["&HFFFFFF&", "&HFFFF00&", "&H00FFFF&"]))
+            dx, dy, life, size, color_idx = next(draws)
+            fx, fy = next(flights)
+            sx = cx + dx
+            sy = cy + dy
+            ex = sx + fx
+            ey = sy + fy
+            s_start = start_ms + int(next(delays) * (dur + 1))
+            s_end = s_start + life
+            star_color = _GHOST_STAR_COLORS[color_idx]
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(s_start)},{self._ms_to_timestamp(s_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({int(sx)},{int(sy)},{int(ex)},{int(ey)})\\fscx{size}\\fscy{size}\\1c{star_color}"
-                f"\\blur6\\frz0\\t(\\frz360)\\fad(200,300)\\p1}}{star_shape}{{\\p0}}"
+                f"\\blur6\\frz0\\t(\\frz360)\\fad(200,300)\\p1}}{_STAR_SHAPE}{{\\p0}}"
             )
     return "\n".join(lines)
 
@@ -385,8 +500,16 @@ def _render_matrix_rain(self) -> str:
     """Port of MatrixRainRenderer: falling glyphs."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     base_color = hex_to_ass(self.style.get("primary_color", "&H00FF00"))
     chars = "01??????????"
+    if not self.words:
+        return "\n".join(lines)
+    n_glyphs = len(self.words) * 15
+    draws = iter(_randint_rows(n_glyphs, (
+        (0, len(chars) - 1), (-200, 200), (200, 400), (100, 300), (500, 1000),
+    )))
+    delays = iter(_unit_draws(n_glyphs))
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -395,16 +518,17 @@ def _render_matrix_rain(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c{base_color}\\fad(100,100)}}{safe_text}"
+            f"{{{pos_tag}\\1c{base_color}\\fad(100,100)}}{safe_text}"
         )
 
         for _ in range(15):
-            char = random.choice(chars)
-            x = cx + random.randint(-200, 200)
-            y_start = cy - random.randint(200, 400)
-            y_end = cy + random.randint(100, 300)
-            c_start = start_ms + random.randint(0, dur)
-            c_end = c_start + random.randint(500, 1000)
+            char_idx, dx, rise, fall, life = next(draws)
+            char = chars[char_idx]
+            x = cx + dx
+            y_start = cy - rise
+            y_end = cy + fall
+            c_start = start_ms + int(next(delays) * (dur + 1))
+            c_end = c_start + life
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(c_start)},{self._ms_to_timestamp(c_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({x},{y_start},{x},{y_end})\\1c{base_color}\\alpha&H80&\\fscx50\\fscy50\\fad(0,200)}}{char}"
@@ -415,7 +539,7 @@ def _render_electric_shock(self) -> str:
     """Port of ElectricShockRenderer: shake + lightning bolts."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    lightning_shape = "m 0 0 l 5 20 l -3 20 l 8 40 l -10 25 l 0 25"
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     base_color = hex_to_ass(self.style.get("primary_color", "&H00FFFF00"))
 
     for word in self.words:
@@ -424,23 +548,23 @@ def _render_electric_shock(self) -> str:
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         shake = "".join(
-            [f"\\t({i*50},{(i+1)*50},\\frz{random.randint(-3,3)})" for i in range(min(dur // 50, 10))]
+            [f"\\t({i*50},{(i+1)*50},\\frz{_randint(-3,3)})" for i in range(min(dur // 50, 10))]
         )
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c{base_color}{shake}}}{safe_text}"
+            f"{{{pos_tag}\\1c{base_color}{shake}}}{safe_text}"
         )
 
         for _ in range(6):
-            lx = cx + random.randint(-80, 80)
-            ly = cy + random.randint(-60, 60)
-            l_start = start_ms + random.randint(0, max(1, dur // 2))
-            l_end = l_start + random.randint(50, 150)
-            rotation = random.randint(0, 360)
+            lx = cx + _randint(-80, 80)
+            ly = cy + _randint(-60, 60)
+            l_start = start_ms + _randint(0, max(1, dur // 2))
+            l_end = l_start + _randint(50, 150)
+            rotation = _randint(0, 360)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(l_start)},{self._ms_to_timestamp(l_end)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({lx},{ly})\\frz{rotation}\\1c{base_color}\\fscx80\\fscy80\\fad(0,50)\\p1}}"
-                f"{lightning_shape}{{\\p0}}"
+                f"{_LIGHTNING_SHAPE}{{\\p0}}"
             )
     return "\n".join(lines)
 
@@ -448,7 +572,14 @@ def _render_smoke_trail(self) -> str:
     """Port of SmokeTrailRenderer: fade-out text with rising smoke."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    smoke_shape = "m 0 0 b 10 -5 20 -5 30 0 b 20 5 10 5 0 0"
+    pos_tag = f"\\an5\\pos({cx},{cy})"
+    if not self.words:
+        return "\n".join(lines)
+    n_puffs = len(self.words) * 10
+    draws = iter(_randint_rows(n_puffs, (
+        (-40, 40), (-20, 20), (50, 100), (800, 1200), (30, 60), (-30, 30),
+    )))
+    delays = iter(_unit_draws(n_puffs))
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -457,20 +588,21 @@ def _render_smoke_trail(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(100,300)\\t({max(dur-200,0)},{dur},\\alpha&HFF&\\blur10)}}{safe_text}"
+            f"{{{pos_tag}\\fad(100,300)\\t({max(dur-200,0)},{dur},\\alpha&HFF&\\blur10)}}{safe_text}"
         )
 
         for _ in range(10):
-            sx = cx + random.randint(-40, 40)
-            sy = cy + random.randint(-20, 20)
-            ey = sy - random.randint(50, 100)
-            s_start = start_ms + random.randint(max(dur // 2, 0), dur)
-            s_end = s_start + random.randint(800, 1200)
-            size = random.randint(30, 60)
+            dx, dy, rise, life, size, drift = next(draws)
+            sx = cx + dx
+            sy = cy + dy
+            ey = sy - rise
+            # Puffs start in the second half of the word
+            s_start = start_ms + dur // 2 + int(next(delays) * (dur - dur // 2 + 1))
+            s_end = s_start + life
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(s_start)},{self._ms_to_timestamp(s_end)},Default,,0,0,0,,"
-                f"{{\\an5\\move({sx},{sy},{sx + random.randint(-30,30)},{ey})\\fscx{size}\\fscy{size}\\1c&HCCCCCC&"
-                f"\\alpha&H40&\\blur8\\t(\\alpha&HFF&\\fscx{size*2}\\fscy{size*2})\\p1}}{smoke_shape}{{\\p0}}"
+                f"{{\\an5\\move({sx},{sy},{sx + drift},{ey})\\fscx{size}\\fscy{size}\\1c&HCCCCCC&"
+                f"\\alpha&H40&\\blur8\\t(\\alpha&HFF&\\fscx{size*2}\\fscy{size*2})\\p1}}{_SMOKE_SHAPE}{{\\p0}}"
             )
     return "\n".join(lines)
 
@@ -479,26 +611,30 @@ def _render_pixel_glitch(self) -> str:
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
     colors = self.effect_config.get("colors", ["&HFF0000&", "&H00FF00&", "&H0000FF&", "&HFFFFFF&"])
+    if not colors or not self.words:
+        return "\n".join(lines)
+    ass_colors = [hex_to_ass(color) for color in colors]
+    # Per layer: base offset, then up to 8 glitch jumps (only the first dur // 100 are used)
+    draws = iter(_randint_rows(len(self.words) * len(colors), ((-5, 5), (-3, 3)) + ((-10, 10), (-5, 5)) * 8))
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
+        glitch_count = min(dur // 100, 8)
 
-        for i, color in enumerate(colors):
-            offset_x = random.randint(-5, 5)
-            offset_y = random.randint(-3, 3)
-            glitch_count = min(dur // 100, 8)
+        for i, color in enumerate(ass_colors):
+            offset_x, offset_y, *jumps = next(draws)
             glitch_times = "".join(
                 [
-                    f"\\t({j*100},{(j+1)*100},\\pos({cx + random.randint(-10,10)},{cy + random.randint(-5,5)}))"
+                    f"\\t({j*100},{(j+1)*100},\\pos({cx + jumps[2 * j]},{cy + jumps[2 * j + 1]}))"
                     for j in range(glitch_count)
                 ]
             )
             lines.append(
                 f"Dialogue: {i},{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx + offset_x},{cy + offset_y})\\1c{hex_to_ass(color)}\\alpha&H60&{glitch_times}}}{safe_text}"
+                f"{{\\an5\\pos({cx + offset_x},{cy + offset_y})\\1c{color}\\alpha&H60&{glitch_times}}}{safe_text}"
             )
     return "\n".join(lines)
 
@@ -506,27 +642,24 @@ def _render_neon_sign(self) -> str:
     """Port of NeonSignRenderer: flickering glow."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     primary = hex_to_ass(self.style.get("primary_color", "&H00FF00FF"))
     outline = hex_to_ass(self.style.get("outline_color", "&H00FF00FF"))
+    # Each 100 ms slot blinks with probability 0.3
+    blink_rows = (_RNG.random((len(self.words), len(_NEON_FLICKER))) < 0.3).tolist()
 
-    for word in self.words:
+    for word, blinks in zip(self.words, blink_rows):
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
-        flicker = ""
-        t = 0
-        while t < min(dur, 1000):
-            if random.random() < 0.3:
-                flicker += f"\\t({t},{t+50},\\alpha&HFF&)\\t({t+50},{t+100},\\alpha&H00&)"
-                t += 100
-            else:
-                t += 100
+        slots = (min(dur, 1000) + 99) // 100
+        flicker = "".join([blink for blink, on in zip(_NEON_FLICKER[:slots], blinks) if on])
 
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c{primary}\\3c{outline}\\bord3\\blur5{flicker}}}{safe_text}"
+            f"{{{pos_tag}\\1c{primary}\\3c{outline}\\bord3\\blur5{flicker}}}{safe_text}"
         )
     return "\n".join(lines)
 
@@ -534,19 +667,14 @@ def _render_fade_in_out(self) -> str:
     """Port of FadeInOutRenderer: sentence-level fade."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     sentence_length = int(self.effect_config.get("sentence_length", 5))
 
-    for sent_start in range(0, len(self.words), sentence_length):
-        sent_words = self.words[sent_start:sent_start + sentence_length]
-        if not sent_words:
-            continue
-        start_ms = int(sent_words[0].get("start", 0) * 1000)
-        end_ms = int(sent_words[-1].get("end", start_ms / 1000) * 1000)
-        full_text = " ".join([(w.get("text") or "").replace("{", r"\{").replace("}", r"\}") for w in sent_words])
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(400,400)}}{full_text}"
-        )
+    lines.extend(
+        f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+        f"{{{pos_tag}\\fad(400,400)}}{full_text}"
+        for start_ts, end_ts, full_text in self._sentence_chunks(sentence_length)
+    )
     return "\n".join(lines)
 
 def _render_slide_up(self) -> str:
@@ -555,36 +683,25 @@ def _render_slide_up(self) -> str:
     cx, cy = self._get_center_coordinates()
     sentence_length = int(self.effect_config.get("sentence_length", 4))
 
-    for sent_start in range(0, len(self.words), sentence_length):
-        sent_words = self.words[sent_start:sent_start + sentence_length]
-        if not sent_words:
-            continue
-        start_ms = int(sent_words[0].get("start", 0) * 1000)
-        end_ms = int(sent_words[-1].get("end", start_ms / 1000) * 1000)
-        full_text = " ".join([(w.get("text") or "").replace("{", r"\{").replace("}", r"\}") for w in sent_words])
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\move({cx},{cy + 100},{cx},{cy},0,300)\\fad(100,200)}}{full_text}"
-        )
+    lines.extend(
+        f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+        f"{{\\an5\\move({cx},{cy + 100},{cx},{cy},0,300)\\fad(100,200)}}{full_text}"
+        for start_ts, end_ts, full_text in self._sentence_chunks(sentence_length)
+    )
     return "\n".join(lines)
 
 def _render_zoom_burst(self) -> str:
     """Port of ZoomBurstRenderer: zoom-in burst per sentence."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     sentence_length = int(self.effect_config.get("sentence_length", 4))
 
-    for sent_start in range(0, len(self.words), sentence_length):
-        sent_words = self.words[sent_start:sent_start + sentence_length]
-        if not sent_words:
-            continue
-        start_ms = int(sent_words[0].get("start", 0) * 1000)
-        end_ms = int(sent_words[-1].get("end", start_ms / 1000) * 1000)
-        full_text = " ".join([(w.get("text") or "").replace("{", r"\{").replace("}", r"\}") for w in sent_words])
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx0\\fscy0\\t(0,300,\\fscx100\\fscy100)\\fad(0,200)}}{full_text}"
-        )
+    lines.extend(
+        f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+        f"{{{pos_tag}\\fscx0\\fscy0\\t(0,300,\\fscx100\\fscy100)\\fad(0,200)}}{full_text}"
+        for start_ts, end_ts, full_text in self._sentence_chunks(sentence_length)
+    )
     return "\n".join(lines)
 
 def _render_bounce_in(self) -> str:
@@ -592,24 +709,18 @@ def _render_bounce_in(self) -> str:
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
     sentence_length = int(self.effect_config.get("sentence_length", 4))
-    bounce = "\\t(0,150,\\fscx120\\fscy120)\\t(150,250,\\fscx95\\fscy95)\\t(250,350,\\fscx105\\fscy105)\\t(350,400,\\fscx100\\fscy100)"
 
-    for sent_start in range(0, len(self.words), sentence_length):
-        sent_words = self.words[sent_start:sent_start + sentence_length]
-        if not sent_words:
-            continue
-        start_ms = int(sent_words[0].get("start", 0) * 1000)
-        end_ms = int(sent_words[-1].get("end", start_ms / 1000) * 1000)
-        full_text = " ".join([(w.get("text") or "").replace("{", r"\{").replace("}", r"\}") for w in sent_words])
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\move({cx},{cy - 100},{cx},{cy},0,400){bounce}\\fad(0,200)}}{full_text}"
-        )
+    lines.extend(
+        f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+        f"{{\\an5\\move({cx},{cy - 100},{cx},{cy},0,400){_BOUNCE_IN}\\fad(0,200)}}{full_text}"
+        for start_ts, end_ts, full_text in self._sentence_chunks(sentence_length)
+    )
     return "\n".join(lines)
 
 def _render_tiktok_yellow_box(self) -> str:
     """TikTok Yellow Box: Opaque box behind each word using BorderStyle=3."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -659,7 +770,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         # Single dialogue line - BorderStyle=3 handles the box automatically
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})"
+            f"{{{pos_tag}"
             f"\\fscx100\\fscy100\\t(0,80,\\fscx105\\fscy105)\\t(80,{dur},\\fscx100\\fscy100)}}"
             f"{text}"
         )
@@ -670,7 +781,14 @@ def _render_falling_heart(self) -> str:
     """Port of FallingHeartRenderer: text drop + raining hearts."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    heart_shape = "m 18 40 b 23 29 35 27 35 16 b 36 8 23 0 18 11 b 14 0 0 8 1 16 b 1 27 14 29 18 40"
+    if not self.words:
+        return "\n".join(lines)
+    n_hearts = len(self.words) * 15
+    draws = iter(_randint_rows(n_hearts, (
+        (-80, 80), (50, 100), (50, 150), (1000, 1500), (20, 40),
+        (0, len(_HEART_SPINS) - 1), (0, len(_HEART_COLORS) - 1), (-50, 50),
+    )))
+    delays = iter(_unit_draws(n_hearts))
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -679,22 +797,22 @@ def _render_falling_heart(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\move({cx},{cy-50},{cx},{cy})\\frz{random.randint(-20, 20)}\\t(\\frz0)\\fad(300,100)}}{safe_text}"
+            f"{{\\an5\\move({cx},{cy-50},{cx},{cy})\\frz{_randint(-20, 20)}\\t(\\frz0)\\fad(300,100)}}{safe_text}"
         )
 
         for _ in range(15):
-            hx = cx + random.randint(-80, 80)
-            hy = cy - random.randint(50, 100)
-            ey = cy + random.randint(50, 150)
-            h_start = start_ms + random.randint(0, dur)
-            h_end = h_start + random.randint(1000, 1500)
-            size = random.randint(20, 40)
-            rotation = random.choice([-500, 500, -700, 700])
-            color = hex_to_ass(random.choice(["&HFF69B4&", "&HFF1493&", "&HFF00FF&"]))
+            dx, rise, fall, life, size, spin_idx, color_idx, drift = next(draws)
+            hx = cx + dx
+            hy = cy - rise
+            ey = cy + fall
+            h_start = start_ms + int(next(delays) * (dur + 1))
+            h_end = h_start + life
+            rotation = _HEART_SPINS[spin_idx]
+            color = _HEART_COLORS[color_idx]
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(h_start)},{self._ms_to_timestamp(h_end)},Default,,0,0,0,,"
-                f"{{\\an5\\move({hx},{hy},{hx + random.randint(-50, 50)},{ey})\\fscx{size}\\fscy{size}\\1c{color}"
-                f"\\blur5\\frz0\\t(\\frz{rotation})\\fad(300,300)\\p1}}{heart_shape}{{\\p0}}"
+                f"{{\\an5\\move({hx},{hy},{hx + drift},{ey})\\fscx{size}\\fscy{size}\\1c{color}"
+                f"\\blur5\\frz0\\t(\\frz{rotation})\\fad(300,300)\\p1}}{_HEART_SHAPE}{{\\p0}}"
             )
     return "\n".join(lines)
 
@@ -702,21 +820,22 @@ def _render_thunder_storm(self) -> str:
     """Port of ThunderStormRenderer: multi-layer storm."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    lightning = "m 0 0 l 5 20 l -3 20 l 8 40 l -10 25 l 0 25"
+    pos_tag = f"\\an5\\pos({cx},{cy})"
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
         # Clouds
         for _ in range(5):
-            cloud_x = cx + random.randint(-150, 150)
-            cloud_y = cy - random.randint(80, 120)
-            cloud_size = random.randint(60, 100)
+            cloud_x = cx + _randint(-150, 150)
+            cloud_y = cy - _randint(80, 120)
+            cloud_size = _randint(60, 100)
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cloud_x},{cloud_y})\\fscx{cloud_size}\\fscy{cloud_size}\\1c&H404040&\\alpha&H60&\\blur20}}?"
             )
 
@@ -726,35 +845,35 @@ def _render_thunder_storm(self) -> str:
             flash_end = flash_start + 100
             lines.append(
                 f"Dialogue: 1,{self._ms_to_timestamp(flash_start)},{self._ms_to_timestamp(flash_end)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\1c&HFFFFFF&\\bord3\\3c&HFFFF00&\\blur5}}{safe_text}"
+                f"{{{pos_tag}\\1c&HFFFFFF&\\bord3\\3c&HFFFF00&\\blur5}}{safe_text}"
             )
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H00FFFF&\\bord2\\3c&H0000FF&\\blur2}}{safe_text}"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\1c&H00FFFF&\\bord2\\3c&H0000FF&\\blur2}}{safe_text}"
         )
 
         # Lightning bolts
         for _ in range(15):
-            lx = cx + random.randint(-120, 120)
-            ly = cy - random.randint(100, 150)
-            l_start = start_ms + random.randint(0, dur)
-            l_end = l_start + random.randint(50, 150)
-            rotation = random.randint(-30, 30)
-            scale = random.randint(80, 150)
+            lx = cx + _randint(-120, 120)
+            ly = cy - _randint(100, 150)
+            l_start = start_ms + _randint(0, dur)
+            l_end = l_start + _randint(50, 150)
+            rotation = _randint(-30, 30)
+            scale = _randint(80, 150)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(l_start)},{self._ms_to_timestamp(l_end)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({lx},{ly})\\frz{rotation}\\fscx{scale}\\fscy{scale}\\1c&HFFFF00&\\blur3\\fad(0,50)\\p1}}"
-                f"{lightning}{{\\p0}}"
+                f"{_LIGHTNING_SHAPE}{{\\p0}}"
             )
 
         # Sparks
         for _ in range(30):
-            sx = cx + random.randint(-100, 100)
-            sy = cy + random.randint(-60, 60)
-            s_end_x = sx + random.randint(-40, 40)
-            s_end_y = sy + random.randint(-40, 40)
-            s_start = start_ms + random.randint(0, dur)
-            s_end = s_start + random.randint(100, 300)
+            sx = cx + _randint(-100, 100)
+            sy = cy + _randint(-60, 60)
+            s_end_x = sx + _randint(-40, 40)
+            s_end_y = sy + _randint(-40, 40)
+            s_start = start_ms + _randint(0, dur)
+            s_end = s_start + _randint(100, 300)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(s_start)},{self._ms_to_timestamp(s_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({sx},{sy},{s_end_x},{s_end_y})\\1c&H00FFFF&\\blur2\\fscx5\\fscy5}}?"
@@ -762,11 +881,11 @@ def _render_thunder_storm(self) -> str:
 
         # Rain
         for _ in range(20):
-            rx = cx + random.randint(-200, 200)
-            ry_start = cy - random.randint(150, 200)
-            ry_end = cy + random.randint(100, 150)
-            r_start = start_ms + random.randint(0, dur)
-            r_end = r_start + random.randint(400, 600)
+            rx = cx + _randint(-200, 200)
+            ry_start = cy - _randint(150, 200)
+            ry_end = cy + _randint(100, 150)
+            r_start = start_ms + _randint(0, dur)
+            r_end = r_start + _randint(400, 600)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(r_start)},{self._ms_to_timestamp(r_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({rx},{ry_start},{rx},{ry_end})\\1c&H808080&\\alpha&H80&\\fscx2\\fscy30\\blur1}}|"
@@ -778,7 +897,7 @@ def _render_thunder_storm(self) -> str:
             flash_end = flash_start + 80
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(flash_start)},{self._ms_to_timestamp(flash_end)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\fscx400\\fscy400\\1c&HFFFFFF&\\alpha&H00&\\blur30\\t(\\alpha&HFF&)}}?"
+                f"{{{pos_tag}\\fscx400\\fscy400\\1c&HFFFFFF&\\alpha&H00&\\blur30\\t(\\alpha&HFF&)}}?"
             )
     return "\n".join(lines)
 
@@ -786,12 +905,11 @@ def _render_ice_crystal(self) -> str:
     """Port of IceCrystalRenderer: icy glow + shards + snow."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    crystal_shape = "m 0 -20 l 5 -5 20 0 5 5 0 20 -5 5 -20 0 -5 -5"
-    snowflake = "m 0 -15 l 0 15 m -15 0 l 15 0 m -10 -10 l 10 10 m -10 10 l 10 -10"
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
@@ -799,40 +917,40 @@ def _render_ice_crystal(self) -> str:
         for i, color in enumerate(ice_colors):
             offset = (i - 1) * 3
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx + offset},{cy + offset})\\1c{hex_to_ass(color)}\\blur18\\alpha&H70&}}{safe_text}"
             )
 
         for i in range(3):
             lines.append(
-                f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx + i},{cy + i})\\1c&HFFFFFF&\\bord2\\3c&HDDFFFF&\\blur1\\fscx110\\fscy110}}{safe_text}"
             )
 
         for i in range(30):
-            angle = (i * 360 / 30) + random.randint(-10, 10)
+            angle = i * 12 + _randint(-10, 10) + _DEG_OFFSET
             distance_start = 30
-            distance_end = random.randint(120, 200)
-            angle_rad = math.radians(angle)
-            cx_start = cx + int(math.cos(angle_rad) * distance_start)
-            cy_start = cy + int(math.sin(angle_rad) * distance_start)
-            cx_end = cx + int(math.cos(angle_rad) * distance_end)
-            cy_end = cy + int(math.sin(angle_rad) * distance_end)
-            c_start = start_ms + random.randint(0, dur // 3)
-            c_end = c_start + random.randint(600, 1000)
-            scale = random.randint(20, 50)
+            distance_end = _randint(120, 200)
+            cos_a, sin_a = _COS_DEG[angle], _SIN_DEG[angle]
+            cx_start = cx + int(cos_a * distance_start)
+            cy_start = cy + int(sin_a * distance_start)
+            cx_end = cx + int(cos_a * distance_end)
+            cy_end = cy + int(sin_a * distance_end)
+            c_start = start_ms + _randint(0, dur // 3)
+            c_end = c_start + _randint(600, 1000)
+            scale = _randint(20, 50)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(c_start)},{self._ms_to_timestamp(c_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({cx_start},{cy_start},{cx_end},{cy_end})\\fscx{scale}\\fscy{scale}\\1c&HFFFFFF&\\blur4"
-                f"\\frz{random.randint(0,360)}\\t(\\frz{random.randint(360,720)})\\t(\\alpha&HFF&)\\p1}}{crystal_shape}{{\\p0}}"
+                f"\\frz{_randint(0,360)}\\t(\\frz{_randint(360,720)})\\t(\\alpha&HFF&)\\p1}}{_SPARKLE_SHAPE}{{\\p0}}"
             )
 
         for _ in range(25):
-            px = cx + random.randint(-150, 150)
-            py = cy + random.randint(-100, 100)
-            p_start = start_ms + random.randint(0, dur)
-            p_end = p_start + random.randint(400, 800)
-            p_size = random.randint(5, 15)
+            px = cx + _randint(-150, 150)
+            py = cy + _randint(-100, 100)
+            p_start = start_ms + _randint(0, dur)
+            p_end = p_start + _randint(400, 800)
+            p_size = _randint(5, 15)
             fade_mid = (p_end - p_start) // 2
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_end)},Default,,0,0,0,,"
@@ -841,28 +959,26 @@ def _render_ice_crystal(self) -> str:
             )
 
         for _ in range(12):
-            sx = cx + random.randint(-100, 100)
-            sy = cy + random.randint(-80, 80)
-            s_start = start_ms + random.randint(0, dur // 2)
-            s_end = s_start + random.randint(1000, 1500)
-            s_size = random.randint(25, 45)
+            sx = cx + _randint(-100, 100)
+            sy = cy + _randint(-80, 80)
+            s_start = start_ms + _randint(0, dur // 2)
+            s_end = s_start + _randint(1000, 1500)
+            s_size = _randint(25, 45)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(s_start)},{self._ms_to_timestamp(s_end)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({sx},{sy})\\fscx{s_size}\\fscy{s_size}\\1c&HFFFFFF&\\blur3\\frz0\\t(\\frz360)\\p1}}"
-                f"{snowflake}{{\\p0}}"
+                f"{_SNOWFLAKE_SHAPE}{{\\p0}}"
             )
 
-        shard_shape = "m 0 0 l 3 -25 l 6 0"
-        for i in range(8):
-            angle = i * 45
-            shard_x = cx + int(math.cos(math.radians(angle)) * 60)
-            shard_y = cy + int(math.sin(math.radians(angle)) * 60)
+        for angle, shard_dx, shard_dy in _ICE_SHARDS:
+            shard_x = cx + shard_dx
+            shard_y = cy + shard_dy
             sh_start = start_ms
             sh_end = start_ms + 400
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(sh_start)},{self._ms_to_timestamp(sh_end)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({shard_x},{shard_y})\\frz{angle}\\fscx80\\fscy80\\1c&HFFFFFF&\\blur2"
-                f"\\t(\\fscx0\\fscy0\\alpha&HFF&)\\p1}}{shard_shape}{{\\p0}}"
+                f"\\t(\\fscx0\\fscy0\\alpha&HFF&)\\p1}}{_SHARD_SHAPE}{{\\p0}}"
             )
     return "\n".join(lines)
 
@@ -870,11 +986,11 @@ def _render_cosmic_stars(self) -> str:
     """Port of CosmicStarsRenderer: galaxy glow + orbiting stars."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    star_shape = "m 0 -20 l 5 -5 20 0 5 5 0 20 -5 5 -20 0 -5 -5"
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
@@ -882,7 +998,7 @@ def _render_cosmic_stars(self) -> str:
         for i, color in enumerate(cosmic_colors):
             offset = (i - 1) * 4
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx + offset},{cy + offset})\\1c{hex_to_ass(color)}\\blur25\\alpha&H60&"
                 f"\\t(0,{dur//2},\\blur30)\\t({dur//2},{dur},\\blur25)}}{safe_text}"
             )
@@ -890,38 +1006,38 @@ def _render_cosmic_stars(self) -> str:
         galaxy_layers = [("&HFF00FF&", 0, 0), ("&HFF00AA&", 2, 1), ("&HFF0066&", 4, 2)]
         for color, ox, oy in galaxy_layers:
             lines.append(
-                f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx + ox},{cy + oy})\\1c{hex_to_ass(color)}\\bord2\\3c&HFFFFFF&\\blur2\\fscx115\\fscy115}}"
                 f"{safe_text}"
             )
 
         for i in range(25):
-            orbit_angle_start = (i * 360 / 25) + random.randint(-20, 20)
-            orbit_angle_end = orbit_angle_start + random.choice([360, -360, 720])
-            radius = random.randint(80, 150)
+            orbit_angle_start = (i * 360 / 25) + _randint(-20, 20)
+            orbit_angle_end = orbit_angle_start + _choice(_COSMIC_ORBIT_TURNS)
+            radius = _randint(80, 150)
             angle_start_rad = math.radians(orbit_angle_start)
             angle_end_rad = math.radians(orbit_angle_end)
             sx_start = cx + int(math.cos(angle_start_rad) * radius)
             sy_start = cy + int(math.sin(angle_start_rad) * radius)
             sx_end = cx + int(math.cos(angle_end_rad) * radius)
             sy_end = cy + int(math.sin(angle_end_rad) * radius)
-            s_start = start_ms + random.randint(0, dur // 3)
-            s_end = s_start + random.randint(1000, 1500)
-            s_size = random.randint(25, 50)
-            star_color = hex_to_ass(random.choice(["&HFFFFFF&", "&HFFFF00&", "&HFF00FF&", "&H00FFFF&"]))
+            s_start = start_ms + _randint(0, dur // 3)
+            s_end = s_start + _randint(1000, 1500)
+            s_size = _randint(25, 50)
+            star_color = _choice(_COSMIC_STAR_COLORS)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(s_start)},{self._ms_to_timestamp(s_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({sx_start},{sy_start},{sx_end},{sy_end})\\fscx{s_size}\\fscy{s_size}\\1c{star_color}\\blur5"
-                f"\\frz0\\t(\\frz360)\\t(\\alpha&HFF&)\\p1}}{star_shape}{{\\p0}}"
+                f"\\frz0\\t(\\frz360)\\t(\\alpha&HFF&)\\p1}}{_SPARKLE_SHAPE}{{\\p0}}"
             )
 
         for _ in range(40):
-            dx = cx + random.randint(-150, 150)
-            dy = cy + random.randint(-100, 100)
-            d_start = start_ms + random.randint(0, dur)
-            d_end = d_start + random.randint(300, 600)
-            d_size = random.randint(3, 10)
-            dust_color = hex_to_ass(random.choice(["&HFFFFFF&", "&HFFCCFF&", "&HCCFFFF&"]))
+            dx = cx + _randint(-150, 150)
+            dy = cy + _randint(-100, 100)
+            d_start = start_ms + _randint(0, dur)
+            d_end = d_start + _randint(300, 600)
+            d_size = _randint(3, 10)
+            dust_color = _choice(_COSMIC_DUST_COLORS)
             fade_mid = (d_end - d_start) // 2
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(d_start)},{self._ms_to_timestamp(d_end)},Default,,0,0,0,,"
@@ -930,22 +1046,22 @@ def _render_cosmic_stars(self) -> str:
             )
 
         for _ in range(8):
-            nx = cx + random.randint(-120, 120)
-            ny = cy + random.randint(-80, 80)
-            n_size = random.randint(80, 140)
-            nebula_color = hex_to_ass(random.choice(["&HFF00FF&", "&HFF0088&", "&H8800FF&"]))
+            nx = cx + _randint(-120, 120)
+            ny = cy + _randint(-80, 80)
+            n_size = _randint(80, 140)
+            nebula_color = _choice(_COSMIC_NEBULA_COLORS)
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({nx},{ny})\\fscx{n_size}\\fscy{n_size}\\1c{nebula_color}\\alpha&HC0&\\blur30}}?"
             )
 
         for _ in range(6):
-            shoot_x_start = cx + random.randint(-200, 200)
-            shoot_y_start = cy - random.randint(100, 150)
-            shoot_x_end = shoot_x_start + random.randint(100, 200)
-            shoot_y_end = shoot_y_start + random.randint(100, 200)
-            sh_start = start_ms + random.randint(0, dur)
-            sh_end = sh_start + random.randint(400, 700)
+            shoot_x_start = cx + _randint(-200, 200)
+            shoot_y_start = cy - _randint(100, 150)
+            shoot_x_end = shoot_x_start + _randint(100, 200)
+            shoot_y_end = shoot_y_start + _randint(100, 200)
+            sh_start = start_ms + _randint(0, dur)
+            sh_end = sh_start + _randint(400, 700)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(sh_start)},{self._ms_to_timestamp(sh_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({shoot_x_start},{shoot_y_start},{shoot_x_end},{shoot_y_end})\\1c&HFFFFFF&\\blur8"
@@ -957,11 +1073,11 @@ def _render_ocean_wave(self) -> str:
     """Port of OceanWaveRenderer: water glow, bubbles, foam."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    bubble_shape = "m 0 16 b 0 16 0 16 0 16 b 0 16 0 16 0 16 b 0 16 0 16 0 16 b 0 16 0 16 0 16 b 0 0 20 0 20 16 b 20 16 20 16 20 16 b 20 33 0 33 0 16"
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
@@ -969,51 +1085,47 @@ def _render_ocean_wave(self) -> str:
         for i, color in enumerate(water_colors):
             offset = (i - 1) * 3
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx + offset},{cy + offset})\\1c{hex_to_ass(color)}\\blur20\\alpha&H70&}}{safe_text}"
             )
 
-        wave_count = 5
-        for i in range(wave_count):
-            wave_offset = int(math.sin((i / wave_count) * math.pi * 2) * 10)
+        for wave_offset in _OCEAN_WAVE_OFFSETS:
             lines.append(
-                f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx},{cy + wave_offset})\\1c&H00CCFF&\\bord2\\3c&H0088FF&\\blur1}}{safe_text}"
             )
 
-        for i in range(40):
-            angle = (i * 360 / 40)
-            radius = random.randint(60, 120)
-            angle_rad = math.radians(angle)
-            wx = cx + int(math.cos(angle_rad) * radius)
-            wy = cy + int(math.sin(angle_rad) * radius) + int(math.sin(angle_rad * 3) * 20)
-            w_start = start_ms + random.randint(0, dur // 2)
-            w_end = w_start + random.randint(800, 1200)
-            w_size = random.randint(15, 35)
+        for cos_a, sin_a, ripple in _OCEAN_RING:
+            radius = _randint(60, 120)
+            wx = cx + int(cos_a * radius)
+            wy = cy + int(sin_a * radius) + ripple
+            w_start = start_ms + _randint(0, dur // 2)
+            w_end = w_start + _randint(800, 1200)
+            w_size = _randint(15, 35)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(w_start)},{self._ms_to_timestamp(w_end)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({wx},{wy})\\fscx{w_size}\\fscy{w_size}\\1c&H00AAFF&\\blur4\\t(\\alpha&HFF&)}}?"
             )
 
         for _ in range(20):
-            bx = cx + random.randint(-100, 100)
-            by_start = cy + random.randint(40, 80)
-            by_end = cy - random.randint(80, 120)
-            b_start = start_ms + random.randint(0, dur)
-            b_end = b_start + random.randint(1000, 1500)
-            b_size = random.randint(20, 40)
+            bx = cx + _randint(-100, 100)
+            by_start = cy + _randint(40, 80)
+            by_end = cy - _randint(80, 120)
+            b_start = start_ms + _randint(0, dur)
+            b_end = b_start + _randint(1000, 1500)
+            b_size = _randint(20, 40)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(b_start)},{self._ms_to_timestamp(b_end)},Default,,0,0,0,,"
-                f"{{\\an5\\move({bx},{by_start},{bx + random.randint(-20,20)},{by_end})\\fscx{b_size}\\fscy{b_size}"
-                f"\\1c&H00DDFF&\\blur5\\t(\\alpha&HFF&)\\p1}}{bubble_shape}{{\\p0}}"
+                f"{{\\an5\\move({bx},{by_start},{bx + _randint(-20,20)},{by_end})\\fscx{b_size}\\fscy{b_size}"
+                f"\\1c&H00DDFF&\\blur5\\t(\\alpha&HFF&)\\p1}}{_OCEAN_BUBBLE_SHAPE}{{\\p0}}"
             )
 
         for _ in range(15):
-            fx = cx + random.randint(-120, 120)
-            fy = cy + random.randint(-40, 40)
-            f_start = start_ms + random.randint(0, dur)
-            f_end = f_start + random.randint(400, 700)
-            f_size = random.randint(10, 25)
+            fx = cx + _randint(-120, 120)
+            fy = cy + _randint(-40, 40)
+            f_start = start_ms + _randint(0, dur)
+            f_end = f_start + _randint(400, 700)
+            f_size = _randint(10, 25)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(f_start)},{self._ms_to_timestamp(f_end)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({fx},{fy})\\fscx{f_size}\\fscy{f_size}\\1c&HFFFFFF&\\alpha&H40&\\blur8"
@@ -1034,11 +1146,11 @@ def _render_butterfly_dance(self) -> str:
     """Port of ButterflyDanceRenderer: butterflies, petals, glow."""
     lines: List[str] = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    butterfly_shape = "m 10 15 b 5 10 0 5 0 0 b 0 5 5 10 10 15 m 10 15 b 15 10 20 5 20 0 b 20 5 15 10 10 15"
 
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
 
@@ -1046,58 +1158,54 @@ def _render_butterfly_dance(self) -> str:
         for i, color in enumerate(flower_colors):
             offset = (i - 1) * 3
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx + offset},{cy + offset})\\1c{hex_to_ass(color)}\\blur18\\alpha&H70&}}{safe_text}"
             )
 
         spring_layers = [("&HFF1493&", 0, 0), ("&HFF69B4&", 2, 1), ("&HFFC0CB&", 4, 2)]
         for color, ox, oy in spring_layers:
             lines.append(
-                f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx + ox},{cy + oy})\\1c{hex_to_ass(color)}\\bord2\\3c&H00FF00&\\blur1\\fscx110\\fscy110}}"
                 f"{safe_text}"
             )
 
-        for i in range(18):
-            t_start = i / 18
-            angle1 = t_start * 360 * 2
-            angle2 = (t_start + 0.5) * 360 * 2
-            radius = 100
-            bx_start = cx + int(math.cos(math.radians(angle1)) * radius)
-            by_start = cy + int(math.sin(math.radians(angle1) * 2) * 50)
-            bx_end = cx + int(math.cos(math.radians(angle2)) * radius)
-            by_end = cy + int(math.sin(math.radians(angle2) * 2) * 50)
-            b_start = start_ms + random.randint(0, dur // 2)
-            b_end = b_start + random.randint(1200, 1800)
-            b_size = random.randint(30, 50)
-            butterfly_color = hex_to_ass(random.choice(["&HFF69B4&", "&HFF00FF&", "&H00FFFF&", "&HFFFF00&"]))
+        for path_sx, path_sy, path_ex, path_ey in _BUTTERFLY_PATH:
+            bx_start = cx + path_sx
+            by_start = cy + path_sy
+            bx_end = cx + path_ex
+            by_end = cy + path_ey
+            b_start = start_ms + _randint(0, dur // 2)
+            b_end = b_start + _randint(1200, 1800)
+            b_size = _randint(30, 50)
+            butterfly_color = _choice(_BUTTERFLY_COLORS)
             wing_flap = "\\t(0,150,\\fscx110\\fscy90)\\t(150,300,\\fscx100\\fscy100)\\t(300,450,\\fscx110\\fscy90)\\t(450,600,\\fscx100\\fscy100)"
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(b_start)},{self._ms_to_timestamp(b_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({bx_start},{by_start},{bx_end},{by_end})\\fscx{b_size}\\fscy{b_size}\\1c{butterfly_color}"
-                f"\\blur4{wing_flap}\\frz{random.randint(0,360)}\\p1}}{butterfly_shape}{{\\p0}}"
+                f"\\blur4{wing_flap}\\frz{_randint(0,360)}\\p1}}{_BUTTERFLY_SHAPE}{{\\p0}}"
             )
 
         for _ in range(25):
-            px = cx + random.randint(-120, 120)
-            py_start = cy - random.randint(80, 120)
-            py_end = cy + random.randint(80, 120)
-            p_start = start_ms + random.randint(0, dur)
-            p_end = p_start + random.randint(1500, 2000)
-            p_size = random.randint(15, 30)
-            petal_color = hex_to_ass(random.choice(["&HFFC0CB&", "&HFF69B4&", "&HFFFFFF&"]))
+            px = cx + _randint(-120, 120)
+            py_start = cy - _randint(80, 120)
+            py_end = cy + _randint(80, 120)
+            p_start = start_ms + _randint(0, dur)
+            p_end = p_start + _randint(1500, 2000)
+            p_size = _randint(15, 30)
+            petal_color = _choice(_PETAL_COLORS)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_end)},Default,,0,0,0,,"
-                f"{{\\an5\\move({px},{py_start},{px + random.randint(-40,40)},{py_end})\\fscx{p_size}\\fscy{p_size}\\1c{petal_color}"
-                f"\\blur5\\frz0\\t(\\frz{random.randint(360,720)})\\t(\\alpha&HFF&)}}??"
+                f"{{\\an5\\move({px},{py_start},{px + _randint(-40,40)},{py_end})\\fscx{p_size}\\fscy{p_size}\\1c{petal_color}"
+                f"\\blur5\\frz0\\t(\\frz{_randint(360,720)})\\t(\\alpha&HFF&)}}??"
             )
 
         for _ in range(30):
-            sx = cx + random.randint(-150, 150)
-            sy = cy + random.randint(-100, 100)
-            s_start = start_ms + random.randint(0, dur)
-            s_end = s_start + random.randint(300, 600)
-            s_size = random.randint(8, 18)
+            sx = cx + _randint(-150, 150)
+            sy = cy + _randint(-100, 100)
+            s_start = start_ms + _randint(0, dur)
+            s_end = s_start + _randint(300, 600)
+            s_size = _randint(8, 18)
             fade_mid = (s_end - s_start) // 2
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(s_start)},{self._ms_to_timestamp(s_end)},Default,,0,0,0,,"
@@ -1119,6 +1227,7 @@ def _render_neon_pulse(self) -> str:
     """Simple neon-style pulse."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
@@ -1128,7 +1237,7 @@ def _render_neon_pulse(self) -> str:
         anim = f"\\t(0,{mid},\\fscx115\\fscy115\\blur10)\\t({mid},{dur},\\fscx100\\fscy100\\blur2)"
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(50,50){anim}}}{safe_text}"
+            f"{{{pos_tag}\\fad(50,50){anim}}}{safe_text}"
         )
     return "\n".join(lines)
 
@@ -1136,20 +1245,20 @@ def _render_kinetic_bounce(self) -> str:
     """Bounce-in with squash/stretch."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    # Everything after the timestamps is the same for every word
+    body = f",Default,,0,0,0,,{{\\an5\\move({cx},{cy-100},{cx},{cy},0,150)\\t(150,250,\\fscx120\\fscy80)\\t(250,400,\\fscx100\\fscy100)}}"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\move({cx},{cy-100},{cx},{cy},0,150)\\t(150,250,\\fscx120\\fscy80)\\t(250,400,\\fscx100\\fscy100)}}{safe_text}"
-        )
+        lines.append(f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)}{body}{safe_text}")
     return "\n".join(lines)
 
 def _render_cinematic_blur(self) -> str:
     """Blur in/out around timing window."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
@@ -1157,7 +1266,7 @@ def _render_cinematic_blur(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur20\\t(0,150,\\blur0)\\t({max(dur-150,0)},{dur},\\blur20)\\fad(100,100)}}{safe_text}"
+            f"{{{pos_tag}\\blur20\\t(0,150,\\blur0)\\t({max(dur-150,0)},{dur},\\blur20)\\fad(100,100)}}{safe_text}"
         )
     return "\n".join(lines)
 
@@ -1165,61 +1274,61 @@ def _render_typewriter_pro(self) -> str:
     """Rotate-in typewriter effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
+    # Everything after the timestamps is the same for every word
+    body = f",Default,,0,0,0,,{{{pos_tag}\\frz90\\t(0,100,\\frz0)}}"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\frz90\\t(0,100,\\frz0)}}{safe_text}"
-        )
+        lines.append(f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)}{body}{safe_text}")
     return "\n".join(lines)
 
 def _render_word_pop(self) -> str:
     """Scale pop per word."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
+    # Everything after the timestamps is the same for every word
+    body = f",Default,,0,0,0,,{{{pos_tag}\\fscx80\\fscy80\\t(0,80,\\fscx110\\fscy110)\\t(80,150,\\fscx100\\fscy100)}}"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx80\\fscy80\\t(0,80,\\fscx110\\fscy110)\\t(80,150,\\fscx100\\fscy100)}}{safe_text}"
-        )
+        lines.append(f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)}{body}{safe_text}")
     return "\n".join(lines)
 
 def _render_retro_arcade(self) -> str:
     """Static retro placeholder."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
+    # Everything after the timestamps is the same for every word
+    body = f",Default,,0,0,0,,{{{pos_tag}}}"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})}}{safe_text}"
-        )
+        lines.append(f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)}{body}{safe_text}")
     return "\n".join(lines)
 
 def _render_news_ticker(self) -> str:
     """Slide-up ticker feel."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    # Everything after the timestamps is the same for every word
+    body = f",Default,,0,0,0,,{{\\an5\\move({cx},{cy+20},{cx},{cy},0,100)}}"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\move({cx},{cy+20},{cx},{cy},0,100)}}{safe_text}"
-        )
+        lines.append(f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)}{body}{safe_text}")
     return "\n".join(lines)
 
 def _render_tiktok_group(self) -> str:
     """Dynamic word grouping with current word emphasis (yellow, larger)."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -1290,7 +1399,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\fad(80,80)}}{full_text}"
+                f"{{{pos_tag}\\fad(80,80)}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -1299,6 +1408,7 @@ def _render_spin_3d(self) -> str:
     """Simple 3D spin using rotations."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
@@ -1306,7 +1416,7 @@ def _render_spin_3d(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\frx10\\fry20\\frz0\\t(0,{dur//2},\\frz360)\\t({dur//2},{dur},\\frz720)}}{safe_text}"
+            f"{{{pos_tag}\\frx10\\fry20\\frz0\\t(0,{dur//2},\\frz360)\\t({dur//2},{dur},\\frz720)}}{safe_text}"
         )
     return "\n".join(lines)
 
@@ -1314,42 +1424,45 @@ def _render_shear_force(self) -> str:
     """Sheared text with slight shake."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
+    # Everything after the timestamps is the same for every word
+    body = f",Default,,0,0,0,,{{{pos_tag}\\fax-0.3\\t(0,200,\\fax0.1)\\t(200,400,\\fax-0.1)}}"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-        lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fax-0.3\\t(0,200,\\fax0.1)\\t(200,400,\\fax-0.1)}}{safe_text}"
-        )
+        lines.append(f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)}{body}{safe_text}")
     return "\n".join(lines)
 
 def _render_double_shadow(self) -> str:
     """Primary text plus two shadow copies."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         # Shadow layers
         lines.append(
-            f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx+3},{cy+3})\\1c&H000000&\\alpha&H80&\\blur3}}{safe_text}"
         )
         lines.append(
-            f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx-3},{cy-3})\\1c&H808080&\\alpha&H80&\\blur3}}{safe_text}"
         )
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})}}{safe_text}"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}}}{safe_text}"
         )
     return "\n".join(lines)
 
 def _render_karaoke_classic(self) -> str:
     """Dynamic word grouping with current word bright (yellow, larger), neighbors dimmed."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -1420,7 +1533,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\fad(80,80)}}{full_text}"
+                f"{{{pos_tag}\\fad(80,80)}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -1428,6 +1541,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_karaoke_pro(self) -> str:
     """Dynamic word grouping with past/current/future colors and scale animation on current word."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -1505,7 +1619,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\fad(80,80)}}{full_text}"
+                f"{{{pos_tag}\\fad(80,80)}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -1513,6 +1627,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_karaoke_sentence(self) -> str:
     """Dynamic word grouping (2-3 words) with active word highlight and scale animation."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -1609,7 +1724,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -1617,6 +1732,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_karaoke_sentence_fill(self) -> str:
     """Dynamic word grouping with karaoke fill effect - active word fills with color from left to right."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -1707,7 +1823,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(group_start_ms)},{self._ms_to_timestamp(group_end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy}){shadow_tag}}}{full_text}"
+            f"{{{pos_tag}{shadow_tag}}}{full_text}"
         )
     
     return "\n".join(lines)
@@ -1716,6 +1832,7 @@ def _render_karaoke_outline_fill(self) -> str:
     """Dynamic word grouping with karaoke outline effect - only the outline fills from left to right.
     The text interior stays hollow/transparent, only the border gets colored."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -1807,7 +1924,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(group_start_ms)},{self._ms_to_timestamp(group_end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy}){shadow_tag}}}{full_text}"
+            f"{{{pos_tag}{shadow_tag}}}{full_text}"
         )
     
     return "\n".join(lines)
@@ -1816,6 +1933,7 @@ def _render_karaoke_wave_fill(self) -> str:
     """Dynamic word grouping with karaoke fill effect combined with wave/rotation animation.
     Words fill from left to right while swaying side to side."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -1905,7 +2023,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         quarter_wave = wave_duration // 4
         
         # Build wave animation tags
-        wave_tags = ""
+        wave_parts = []
         current_time = 0
         for cycle in range(wave_cycles):
             t1 = current_time
@@ -1914,15 +2032,16 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             t4 = current_time + quarter_wave * 3
             t5 = current_time + quarter_wave * 4
             
-            wave_tags += f"\\t({t1},{t2},\\frz{wave_angle})\\t({t2},{t3},\\frz0)\\t({t3},{t4},\\frz-{wave_angle})\\t({t4},{t5},\\frz0)"
+            wave_parts.append(f"\\t({t1},{t2},\\frz{wave_angle})\\t({t2},{t3},\\frz0)\\t({t3},{t4},\\frz-{wave_angle})\\t({t4},{t5},\\frz0)")
             current_time = t5
+        wave_tags = "".join(wave_parts)
         
         # Add shadow color override if specified
         shadow_tag = f"\\4c{shadow_color}" if shadow > 0 else ""
         
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(group_start_ms)},{self._ms_to_timestamp(group_end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\frz0{wave_tags}{shadow_tag}}}{full_text}"
+            f"{{{pos_tag}\\frz0{wave_tags}{shadow_tag}}}{full_text}"
         )
     
     return "\n".join(lines)
@@ -1931,6 +2050,7 @@ def _render_underline_sweep(self) -> str:
     """Dynamic word grouping with underline under active word.
     Uses inline styling for perfect word-level alignment."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -1996,7 +2116,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(group_start_ms)},{self._ms_to_timestamp(group_end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+            f"{{{pos_tag}}}{full_text}"
         )
         
         # Layer 1: Each word timing with underline on active word only
@@ -2021,7 +2141,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 1,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(word_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{styled_text}"
+                f"{{{pos_tag}}}{styled_text}"
             )
     
     return "\n".join(lines)
@@ -2030,6 +2150,7 @@ def _render_box_slide(self) -> str:
     """Dynamic word grouping with box highlight using BorderStyle=3.
     Uses ASS native box feature for perfect alignment."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -2118,7 +2239,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(word_end_ms)},BoxedWord,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{styled_text}"
+                f"{{{pos_tag}}}{styled_text}"
             )
     
     return "\n".join(lines)
@@ -2126,6 +2247,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_karaoke_sentence_box(self) -> str:
     """Dynamic word grouping (2-3 words) with animated box sliding between fixed-position words."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -2254,7 +2376,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -2262,6 +2384,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_dynamic_highlight(self) -> str:
     """Dynamic word grouping with highlight transition (primary to secondary) on current word."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -2307,6 +2430,10 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         group_start_ms = int(group[0].get("start", 0) * 1000)
         group_end_ms = int(group[-1].get("end", group_start_ms / 1000) * 1000)
         
+        # Escape and format every word once per group; each line then only swaps in the active word
+        safe_texts = [(w.get("text") or "").replace("{", r"\{").replace("}", r"\}") for w in group]
+        idle_parts = [f"{{\\1c{primary_color}}}{word_text}" for word_text in safe_texts]
+        
         for word_idx, active_word in enumerate(group):
             word_start_ms = int(active_word.get("start", 0) * 1000)
             word_end_ms = int(active_word.get("end", word_start_ms / 1000) * 1000)
@@ -2317,24 +2444,17 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             else:
                 line_end_ms = word_end_ms
             
-            text_parts = []
-            for idx, w in enumerate(group):
-                word_text = (w.get("text") or "").replace("{", r"\{").replace("}", r"\}")
-                
-                if idx == word_idx:
-                    # Active word: animate color from primary to secondary and back
-                    text_parts.append(
-                        f"{{\\1c{primary_color}\\t(0,150,\\1c{secondary_color})\\t({max(word_dur-150,0)},{word_dur},\\1c{primary_color})}}{word_text}"
-                    )
-                else:
-                    # Other words: primary color
-                    text_parts.append(f"{{\\1c{primary_color}}}{word_text}")
+            # Active word: animate color from primary to secondary and back; others stay primary
+            text_parts = idle_parts.copy()
+            text_parts[word_idx] = (
+                f"{{\\1c{primary_color}\\t(0,150,\\1c{secondary_color})\\t({max(word_dur-150,0)},{word_dur},\\1c{primary_color})}}{safe_texts[word_idx]}"
+            )
             
             full_text = " ".join(text_parts)
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\fad(100,100)}}{full_text}"
+                f"{{{pos_tag}\\fad(100,100)}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -2342,6 +2462,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_tiktok_box_group(self) -> str:
     """Grouped opaque box around current word using BorderStyle=3."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     # Style parameters
     font = self.style.get("font", "Arial")
@@ -2391,7 +2512,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         # Single dialogue line - BorderStyle=3 handles the box automatically
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})"
+            f"{{{pos_tag}"
             f"\\fscx100\\fscy100\\t(0,100,\\fscx108\\fscy108)\\t(100,{dur},\\fscx100\\fscy100)}}"
             f"{text}"
         )
@@ -2402,7 +2523,7 @@ def _render_sakura_dream(self) -> str:
     """Petal drift with soft glow."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    petal_shape = "m 0 0 b 10 -5 20 -5 30 0 b 20 5 10 5 0 0"
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
@@ -2410,20 +2531,20 @@ def _render_sakura_dream(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H00FF69B4&\\blur4\\fad(150,150)}}{safe_text}"
+            f"{{{pos_tag}\\1c&H00FF69B4&\\blur4\\fad(150,150)}}{safe_text}"
         )
         for _ in range(20):
-            px = cx + random.randint(-150, 150)
-            py = cy - random.randint(50, 150)
-            py_end = py + random.randint(120, 220)
-            p_start = start_ms + random.randint(0, dur)
-            p_end = p_start + random.randint(800, 1400)
-            size = random.randint(20, 40)
+            px = cx + _randint(-150, 150)
+            py = cy - _randint(50, 150)
+            py_end = py + _randint(120, 220)
+            p_start = start_ms + _randint(0, dur)
+            p_end = p_start + _randint(800, 1400)
+            size = _randint(20, 40)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_end)},Default,,0,0,0,,"
-                f"{{\\an5\\move({px},{py},{px + random.randint(-40,40)},{py_end})\\fscx{size}\\fscy{size}"
-                f"\\1c&H00FFC0CB&\\blur6\\frz{random.randint(0,360)}\\t(\\frz{random.randint(360,720)})\\fad(0,200)\\p1}}"
-                f"{petal_shape}{{\\p0}}"
+                f"{{\\an5\\move({px},{py},{px + _randint(-40,40)},{py_end})\\fscx{size}\\fscy{size}"
+                f"\\1c&H00FFC0CB&\\blur6\\frz{_randint(0,360)}\\t(\\frz{_randint(360,720)})\\fad(0,200)\\p1}}"
+                f"{_PETAL_SHAPE}{{\\p0}}"
             )
     return "\n".join(lines)
 
@@ -2431,7 +2552,7 @@ def _render_phoenix_flames(self) -> str:
     """Rising flame particles."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
-    flame_shape = "m 0 0 b 5 -10 10 -10 15 0 b 10 15 5 15 0 0"
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
@@ -2439,21 +2560,21 @@ def _render_phoenix_flames(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0000FF&\\bord2\\3c&H00FFFF00&\\blur1}}{safe_text}"
+            f"{{{pos_tag}\\1c&H0000FF&\\bord2\\3c&H00FFFF00&\\blur1}}{safe_text}"
         )
         for _ in range(18):
-            sx = cx + random.randint(-80, 80)
-            sy = cy + random.randint(-20, 20)
-            ex = sx + random.randint(-30, 30)
-            ey = sy - random.randint(120, 200)
-            f_start = start_ms + random.randint(0, dur)
-            f_end = f_start + random.randint(700, 1200)
-            size = random.randint(20, 50)
-            color = hex_to_ass(random.choice(["&H00FF8800&", "&H00FFAA00&", "&H00FF4500&"]))
+            sx = cx + _randint(-80, 80)
+            sy = cy + _randint(-20, 20)
+            ex = sx + _randint(-30, 30)
+            ey = sy - _randint(120, 200)
+            f_start = start_ms + _randint(0, dur)
+            f_end = f_start + _randint(700, 1200)
+            size = _randint(20, 50)
+            color = _choice(_PHOENIX_COLORS)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(f_start)},{self._ms_to_timestamp(f_end)},Default,,0,0,0,,"
                 f"{{\\an5\\move({sx},{sy},{ex},{ey})\\fscx{size}\\fscy{size}\\1c{color}\\blur4\\fad(0,200)\\p1}}"
-                f"{flame_shape}{{\\p0}}"
+                f"{_FLAME_SHAPE}{{\\p0}}"
             )
     return "\n".join(lines)
 
@@ -2461,6 +2582,7 @@ def _render_welcome_my_life(self) -> str:
     """Bold pop-in."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
@@ -2468,7 +2590,7 @@ def _render_welcome_my_life(self) -> str:
         safe_text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx0\\fscy0\\t(0,200,\\fscx110\\fscy110)\\t(200,{dur},\\fscx100\\fscy100)\\fad(100,100)}}{safe_text}"
+            f"{{{pos_tag}\\fscx0\\fscy0\\t(0,200,\\fscx110\\fscy110)\\t(200,{dur},\\fscx100\\fscy100)\\fad(100,100)}}{safe_text}"
         )
     return "\n".join(lines)
 
@@ -2476,6 +2598,7 @@ def _render_mademyday(self) -> str:
     """Highlight active word with slight scale bump."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     words = self.words
     active_scale = 1.12
     for i, word in enumerate(words):
@@ -2493,7 +2616,7 @@ def _render_mademyday(self) -> str:
         full = " ".join(parts)
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\fad(80,80)}}{full}"
+                f"{{{pos_tag}\\fad(80,80)}}{full}"
             )
     return "\n".join(lines)
 
@@ -2529,6 +2652,7 @@ def _render_horror_flicker(self) -> str:
     """Horror movie - random flicker with blood red flash."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2540,21 +2664,21 @@ def _render_horror_flicker(self) -> str:
         flicker_times = []
         t = 0
         while t < dur:
-            step = random.randint(30, 80)
-            alpha_on = "&H00&" if random.random() > 0.3 else "&HFF&"
+            step = _randint(30, 80)
+            alpha_on = "&H00&" if _random() > 0.3 else "&HFF&"
             flicker_times.append(f"\\t({t},{t+step},\\alpha{alpha_on})")
             t += step
         
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0000FF&\\blur1{''.join(flicker_times)}}}{text}"
+            f"{{{pos_tag}\\1c&H0000FF&\\blur1{''.join(flicker_times)}}}{text}"
         )
         
         # Blood red flash overlay
-        flash_start = start_ms + random.randint(0, dur//2)
+        flash_start = start_ms + _randint(0, dur//2)
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(flash_start)},{self._ms_to_timestamp(flash_start + 100)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0000AA&\\blur20\\fscx300\\fscy300\\alpha&H80&\\t(0,100,\\alpha&HFF&)}}{text}"
+            f"{{{pos_tag}\\1c&H0000AA&\\blur20\\fscx300\\fscy300\\alpha&H80&\\t(0,100,\\alpha&HFF&)}}{text}"
         )
     return "\n".join(lines)
 
@@ -2562,6 +2686,7 @@ def _render_old_film(self) -> str:
     """Old film - shake, scratches, sepia tone."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2573,21 +2698,21 @@ def _render_old_film(self) -> str:
         jitter_anims = []
         t = 0
         while t < dur:
-            step = random.randint(40, 80)
-            dx = random.randint(-3, 3)
-            dy = random.randint(-2, 2)
+            step = _randint(40, 80)
+            dx = _randint(-3, 3)
+            dy = _randint(-2, 2)
             jitter_anims.append(f"\\t({t},{t+step},\\pos({cx+dx},{cy+dy}))")
             t += step
         
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H8BD0E6&\\blur0.5{''.join(jitter_anims)}}}{text}"
+            f"{{{pos_tag}\\1c&H8BD0E6&\\blur0.5{''.join(jitter_anims)}}}{text}"
         )
         
         # Vertical scratch lines
         for _ in range(3):
-            scratch_x = cx + random.randint(-200, 200)
-            scratch_start = start_ms + random.randint(0, dur)
+            scratch_x = cx + _randint(-200, 200)
+            scratch_start = start_ms + _randint(0, dur)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(scratch_start)},{self._ms_to_timestamp(min(scratch_start + 150, end_ms))},Default,,0,0,0,,"
                 f"{{\\an5\\pos({scratch_x},{cy})\\1c&HFFFFFF&\\alpha&H80&\\fscx2\\fscy800\\t(0,150,\\alpha&HFF&)}}|"
@@ -2598,6 +2723,7 @@ def _render_action_impact(self) -> str:
     """Action movie - zoom + shake + flash combo."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2610,14 +2736,14 @@ def _render_action_impact(self) -> str:
         t = 150
         while t < dur:
             step = 30
-            dx = random.randint(-8, 8)
-            dy = random.randint(-5, 5)
+            dx = _randint(-8, 8)
+            dy = _randint(-5, 5)
             shake_anims.append(f"\\t({t},{t+step},\\pos({cx+dx},{cy+dy}))")
             t += step
         
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx300\\fscy300\\alpha&HFF&"
+            f"{{{pos_tag}\\fscx300\\fscy300\\alpha&HFF&"
             f"\\t(0,100,\\fscx120\\fscy120\\alpha&H00&)"
             f"\\t(100,200,\\fscx100\\fscy100)"
             f"{''.join(shake_anims)}}}{text}"
@@ -2626,7 +2752,7 @@ def _render_action_impact(self) -> str:
         # Impact flash
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + 150)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&HFFFFFF&\\blur30\\fscx500\\fscy500\\alpha&H40&\\t(0,150,\\alpha&HFF&)}}●"
+            f"{{{pos_tag}\\1c&HFFFFFF&\\blur30\\fscx500\\fscy500\\alpha&H40&\\t(0,150,\\alpha&HFF&)}}●"
         )
     return "\n".join(lines)
 
@@ -2634,6 +2760,7 @@ def _render_dramatic_reveal(self) -> str:
     """Dramatic reveal from black with blur."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2645,7 +2772,7 @@ def _render_dramatic_reveal(self) -> str:
         
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})"
+            f"{{{pos_tag}"
             f"\\blur20\\alpha&HFF&\\fscx80\\fscy80"
             f"\\t(0,{reveal_time},\\blur0\\alpha&H00&\\fscx100\\fscy100)"
             f"\\t({dur - reveal_time},{dur},\\blur10\\alpha&H80&)}}"
@@ -2660,17 +2787,19 @@ def _render_hypnotic_spiral(self) -> str:
     """Hypnotic spiral with rotating text."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
         # Main text with slow rotation
         lines.append(
-            f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\frz0\\t(0,{dur},\\frz360)\\fad(150,150)}}{text}"
+            f"Dialogue: 2,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\frz0\\t(0,{dur},\\frz360)\\fad(150,150)}}{text}"
         )
         
         # Spiral rings behind
@@ -2678,8 +2807,8 @@ def _render_hypnotic_spiral(self) -> str:
             ring_size = 100 + i * 80
             rot_offset = i * 72
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\1c&HFF00FF&\\alpha&H80&\\frz{rot_offset}"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
+                f"{{{pos_tag}\\1c&HFF00FF&\\alpha&H80&\\frz{rot_offset}"
                 f"\\t(0,{dur},\\frz{rot_offset + 720})\\fscx{ring_size}\\fscy{ring_size}\\bord0}}◯"
             )
     return "\n".join(lines)
@@ -2688,10 +2817,12 @@ def _render_mirror_reflect(self) -> str:
     """Mirror reflection - inverted faded copy below."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
@@ -2700,13 +2831,13 @@ def _render_mirror_reflect(self) -> str:
         
         # Main text
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(100,100)}}{text}"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\fad(100,100)}}{text}"
         )
         
         # Reflection (flipped, faded, blurred)
         lines.append(
-            f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx},{reflect_y})\\fscy-100\\alpha&H80&\\blur2"
             f"\\1a&H40&\\fad(100,100)}}{text}"
         )
@@ -2716,6 +2847,7 @@ def _render_shadow_clone(self) -> str:
     """Ninja shadow clones - delayed copies."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2738,7 +2870,7 @@ def _render_shadow_clone(self) -> str:
         # Main text (front)
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(50,50)}}{text}"
+            f"{{{pos_tag}\\fad(50,50)}}{text}"
         )
     return "\n".join(lines)
 
@@ -2746,6 +2878,7 @@ def _render_echo_trail(self) -> str:
     """Motion trail with fading echoes."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2768,7 +2901,7 @@ def _render_echo_trail(self) -> str:
         # Main text
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})}}{text}"
+            f"{{{pos_tag}}}{text}"
         )
     return "\n".join(lines)
 
@@ -2776,10 +2909,12 @@ def _render_double_vision(self) -> str:
     """Drunk effect - two blurry copies."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
@@ -2788,7 +2923,7 @@ def _render_double_vision(self) -> str:
         t = 0
         while t < dur:
             step = 100
-            offset = 15 + random.randint(-5, 5)
+            offset = 15 + _randint(-5, 5)
             wobble_anims.append(f"\\t({t},{t+step},\\pos({cx - offset},{cy}))")
             t += step
             if t < dur:
@@ -2797,20 +2932,20 @@ def _render_double_vision(self) -> str:
         
         # Left blurry copy
         lines.append(
-            f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx - 20},{cy})\\blur4\\alpha&H60&{''.join(wobble_anims)}}}{text}"
         )
         
         # Right blurry copy
         lines.append(
-            f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx + 20},{cy})\\blur4\\alpha&H60&}}{text}"
         )
         
         # Main (slightly blurred)
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur1}}{text}"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\blur1}}{text}"
         )
     return "\n".join(lines)
 
@@ -2853,12 +2988,12 @@ def _render_slam_ground(self) -> str:
         
         # Dust particles
         for _ in range(8):
-            px = cx + random.randint(-100, 100)
+            px = cx + _randint(-100, 100)
             py = cy + 20
             lines.append(
                 f"Dialogue: 1,{self._ms_to_timestamp(start_ms + drop_time)},{self._ms_to_timestamp(start_ms + drop_time + 400)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({px},{py})\\1c&HCCCCCC&\\blur3\\fscx20\\fscy20"
-                f"\\t(0,400,\\pos({px + random.randint(-50, 50)},{py - random.randint(50, 150)})\\alpha&HFF&)}}●"
+                f"\\t(0,400,\\pos({px + _randint(-50, 50)},{py - _randint(50, 150)})\\alpha&HFF&)}}●"
             )
     return "\n".join(lines)
 
@@ -2866,6 +3001,7 @@ def _render_speed_lines(self) -> str:
     """Anime speed lines in background."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2876,17 +3012,17 @@ def _render_speed_lines(self) -> str:
         # Speed lines radiating from center
         for i in range(12):
             angle = i * 30
-            line_start = start_ms + random.randint(0, 100)
+            line_start = start_ms + _randint(0, 100)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(line_start)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\frz{angle}\\1c&HFFFFFF&\\alpha&H80&"
+                f"{{{pos_tag}\\frz{angle}\\1c&HFFFFFF&\\alpha&H80&"
                 f"\\fscx400\\fscy2\\blur1\\t(0,{dur},\\fscx800\\alpha&HFF&)}}―"
             )
         
         # Main text with slight zoom
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx95\\fscy95\\t(0,{dur},\\fscx105\\fscy105)}}{text}"
+            f"{{{pos_tag}\\fscx95\\fscy95\\t(0,{dur},\\fscx105\\fscy105)}}{text}"
         )
     return "\n".join(lines)
 
@@ -2894,10 +3030,12 @@ def _render_power_up(self) -> str:
     """Dragon Ball style power-up aura."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
@@ -2907,8 +3045,8 @@ def _render_power_up(self) -> str:
             blur_amount = 15 + i * 5
             scale = 110 + i * 10
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\1c{color}\\blur{blur_amount}\\alpha&H80&"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
+                f"{{{pos_tag}\\1c{color}\\blur{blur_amount}\\alpha&H80&"
                 f"\\fscx{scale}\\fscy{scale}"
                 f"\\t(0,{dur//2},\\fscx{scale+20}\\fscy{scale+20})"
                 f"\\t({dur//2},{dur},\\fscx{scale}\\fscy{scale})}}{text}"
@@ -2916,19 +3054,19 @@ def _render_power_up(self) -> str:
         
         # Rising energy particles
         for _ in range(15):
-            px = cx + random.randint(-80, 80)
-            py = cy + random.randint(-20, 40)
-            p_start = start_ms + random.randint(0, dur // 2)
+            px = cx + _randint(-80, 80)
+            py = cy + _randint(-20, 40)
+            p_start = start_ms + _randint(0, dur // 2)
             lines.append(
                 f"Dialogue: 1,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({px},{py})\\1c&H00FFFF&\\blur4\\fscx10\\fscy10"
-                f"\\t(0,{dur},\\pos({px + random.randint(-20, 20)},{py - random.randint(100, 200)})\\alpha&HFF&)}}●"
+                f"\\t(0,{dur},\\pos({px + _randint(-20, 20)},{py - _randint(100, 200)})\\alpha&HFF&)}}●"
             )
         
         # Main text
         lines.append(
-            f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\t(0,100,\\fscx110\\fscy110)\\t(100,{dur},\\fscx100\\fscy100)}}{text}"
+            f"Dialogue: 2,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\t(0,100,\\fscx110\\fscy110)\\t(100,{dur},\\fscx100\\fscy100)}}{text}"
         )
     return "\n".join(lines)
 
@@ -2936,6 +3074,7 @@ def _render_punch_hit(self) -> str:
     """Punch impact - zoom + shake + stars."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2948,15 +3087,15 @@ def _render_punch_hit(self) -> str:
         t = 80
         while t < min(dur, 400):
             step = 25
-            dx = random.randint(-12, 12)
-            dy = random.randint(-8, 8)
+            dx = _randint(-12, 12)
+            dy = _randint(-8, 8)
             shake_anims.append(f"\\t({t},{t+step},\\pos({cx+dx},{cy+dy}))")
             t += step
         
         # Main text with impact
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx150\\fscy150"
+            f"{{{pos_tag}\\fscx150\\fscy150"
             f"\\t(0,80,\\fscx100\\fscy100){''.join(shake_anims)}}}{text}"
         )
         
@@ -2964,15 +3103,15 @@ def _render_punch_hit(self) -> str:
         star_chars = ["✦", "✧", "★", "☆"]
         for i in range(6):
             angle = i * 60
-            dist = 80 + random.randint(0, 40)
+            dist = 80 + _randint(0, 40)
             import math
             sx = cx + int(dist * math.cos(math.radians(angle)))
             sy = cy + int(dist * math.sin(math.radians(angle)))
             lines.append(
                 f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + 400)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\1c&H00FFFF&\\fscx30\\fscy30"
+                f"{{{pos_tag}\\1c&H00FFFF&\\fscx30\\fscy30"
                 f"\\t(0,200,\\pos({sx},{sy})\\fscx60\\fscy60)"
-                f"\\t(200,400,\\alpha&HFF&)}}{random.choice(star_chars)}"
+                f"\\t(200,400,\\alpha&HFF&)}}{_choice(star_chars)}"
             )
     return "\n".join(lines)
 
@@ -2980,6 +3119,7 @@ def _render_explosion_entry(self) -> str:
     """Explosion entry - smoke clears to reveal text."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -2992,17 +3132,17 @@ def _render_explosion_entry(self) -> str:
         # Explosion flash
         lines.append(
             f"Dialogue: 3,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + 100)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H00FFFF&\\blur50\\fscx500\\fscy500\\alpha&H40&"
+            f"{{{pos_tag}\\1c&H00FFFF&\\blur50\\fscx500\\fscy500\\alpha&H40&"
             f"\\t(0,100,\\alpha&HFF&)}}●"
         )
         
         # Smoke particles
         for _ in range(20):
-            px = cx + random.randint(-50, 50)
-            py = cy + random.randint(-30, 30)
-            end_px = px + random.randint(-150, 150)
-            end_py = py + random.randint(-150, 150)
-            smoke_size = random.randint(40, 100)
+            px = cx + _randint(-50, 50)
+            py = cy + _randint(-30, 30)
+            end_px = px + _randint(-150, 150)
+            end_py = py + _randint(-150, 150)
+            smoke_size = _randint(40, 100)
             lines.append(
                 f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + explosion_dur + 200)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({px},{py})\\1c&H888888&\\blur8\\fscx{smoke_size}\\fscy{smoke_size}"
@@ -3012,7 +3152,7 @@ def _render_explosion_entry(self) -> str:
         # Main text appears after smoke
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + explosion_dur // 2)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\alpha&HFF&\\blur10"
+            f"{{{pos_tag}\\alpha&HFF&\\blur10"
             f"\\t(0,{explosion_dur},\\alpha&H00&\\blur0)}}{text}"
         )
     return "\n".join(lines)
@@ -3024,6 +3164,7 @@ def _render_paint_brush(self) -> str:
     """Text painted with brush strokes."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3036,18 +3177,18 @@ def _render_paint_brush(self) -> str:
         # Brush stroke effect (clip reveal from left to right)
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx0\\t(0,{stroke_dur},\\fscx100)"
+            f"{{{pos_tag}\\fscx0\\t(0,{stroke_dur},\\fscx100)"
             f"\\blur2\\t({stroke_dur},{stroke_dur + 100},\\blur0)}}{text}"
         )
         
         # Paint splatter particles
         colors = ["&H0000FF&", "&H00FF00&", "&HFF0000&", "&HFFFF00&", "&HFF00FF&"]
         for _ in range(8):
-            px = cx + random.randint(-150, 150)
-            py = cy + random.randint(-50, 50)
-            p_start = start_ms + random.randint(0, stroke_dur)
-            color = random.choice(colors)
-            size = random.randint(10, 30)
+            px = cx + _randint(-150, 150)
+            py = cy + _randint(-50, 50)
+            p_start = start_ms + _randint(0, stroke_dur)
+            color = _choice(colors)
+            size = _randint(10, 30)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_start + 300)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({px},{py})\\1c{color}\\blur3\\fscx{size}\\fscy{size}"
@@ -3059,6 +3200,7 @@ def _render_graffiti_spray(self) -> str:
     """Spray paint graffiti effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3070,26 +3212,26 @@ def _render_graffiti_spray(self) -> str:
         
         # Spray particles appearing
         for i in range(30):
-            px = cx + random.randint(-120, 120)
-            py = cy + random.randint(-40, 40)
+            px = cx + _randint(-120, 120)
+            py = cy + _randint(-40, 40)
             p_start = start_ms + int((i / 30) * spray_dur)
-            size = random.randint(3, 8)
+            size = _randint(3, 8)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({px},{py})\\blur1\\alpha&H{random.randint(0, 60):02X}&\\fscx{size}\\fscy{size}}}●"
+                f"{{\\an5\\pos({px},{py})\\blur1\\alpha&H{_randint(0, 60):02X}&\\fscx{size}\\fscy{size}}}●"
             )
         
         # Main text with drip effect
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms + spray_dur // 2)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\alpha&HFF&\\t(0,{spray_dur // 2},\\alpha&H00&)}}{text}"
+            f"{{{pos_tag}\\alpha&HFF&\\t(0,{spray_dur // 2},\\alpha&H00&)}}{text}"
         )
         
         # Drip lines
         for _ in range(3):
-            drip_x = cx + random.randint(-80, 80)
+            drip_x = cx + _randint(-80, 80)
             drip_start = start_ms + spray_dur
-            drip_len = random.randint(30, 80)
+            drip_len = _randint(30, 80)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(drip_start)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({drip_x},{cy + 30})\\fscx3\\fscy0\\t(0,500,\\fscy{drip_len})}}|"
@@ -3100,33 +3242,35 @@ def _render_neon_flicker(self) -> str:
     """Realistic neon - some letters flicker broken."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
         # Glow layer
         lines.append(
-            f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur15\\alpha&H60&}}{text}"
+            f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\blur15\\alpha&H60&}}{text}"
         )
         
         # Main neon with flicker
         flicker_anims = []
         t = 0
         while t < dur:
-            if random.random() < 0.3:  # 30% chance of flicker
+            if _random() < 0.3:  # 30% chance of flicker
                 flicker_anims.append(f"\\t({t},{t+30},\\alpha&H80&)")
                 flicker_anims.append(f"\\t({t+30},{t+60},\\alpha&H00&)")
                 t += 60
             else:
-                t += random.randint(100, 300)
+                t += _randint(100, 300)
         
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur1{''.join(flicker_anims)}}}{text}"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\blur1{''.join(flicker_anims)}}}{text}"
         )
     return "\n".join(lines)
 
@@ -3134,6 +3278,7 @@ def _render_watercolor_bleed(self) -> str:
     """Watercolor paint bleeding effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3146,8 +3291,8 @@ def _render_watercolor_bleed(self) -> str:
         # Watercolor bleed layers
         colors = ["&HFF9999&", "&H99FF99&", "&H9999FF&", "&HFFFF99&"]
         for i, color in enumerate(colors):
-            offset_x = random.randint(-15, 15)
-            offset_y = random.randint(-10, 10)
+            offset_x = _randint(-15, 15)
+            offset_y = _randint(-10, 10)
             blur = 10 + i * 5
             delay = i * 50
             lines.append(
@@ -3159,7 +3304,7 @@ def _render_watercolor_bleed(self) -> str:
         # Main text
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(200,200)}}{text}"
+            f"{{{pos_tag}\\fad(200,200)}}{text}"
         )
     return "\n".join(lines)
 
@@ -3167,6 +3312,7 @@ def _render_chalk_write(self) -> str:
     """Chalkboard writing effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3178,9 +3324,9 @@ def _render_chalk_write(self) -> str:
         
         # Chalk dust particles
         for _ in range(15):
-            px = cx + random.randint(-100, 100)
-            py = cy + random.randint(-30, 50)
-            p_start = start_ms + random.randint(0, write_dur)
+            px = cx + _randint(-100, 100)
+            py = cy + _randint(-30, 50)
+            p_start = start_ms + _randint(0, write_dur)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_start + 300)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({px},{py})\\1c&HFFFFFF&\\blur2\\fscx5\\fscy5\\alpha&H80&"
@@ -3190,14 +3336,14 @@ def _render_chalk_write(self) -> str:
         # Main text with rough texture effect
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&HFFFFFF&\\blur0.5"
+            f"{{{pos_tag}\\1c&HFFFFFF&\\blur0.5"
             f"\\fscx0\\t(0,{write_dur},\\fscx100)}}{text}"
         )
         
         # Slight texture overlay
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(start_ms + write_dur)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&HDDDDDD&\\blur1\\alpha&HC0&}}{text}"
+            f"{{{pos_tag}\\1c&HDDDDDD&\\blur1\\alpha&HC0&}}{text}"
         )
     return "\n".join(lines)
 
@@ -3208,6 +3354,7 @@ def _render_pixelate_form(self) -> str:
     """Pixel blocks form into text."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3219,14 +3366,14 @@ def _render_pixelate_form(self) -> str:
         
         # Random pixel blocks converging
         for i in range(25):
-            start_x = cx + random.randint(-200, 200)
-            start_y = cy + random.randint(-150, 150)
-            end_x = cx + random.randint(-50, 50)
-            end_y = cy + random.randint(-20, 20)
+            start_x = cx + _randint(-200, 200)
+            start_y = cy + _randint(-150, 150)
+            end_x = cx + _randint(-50, 50)
+            end_y = cy + _randint(-20, 20)
             delay = int((i / 25) * pixel_dur)
-            size = random.randint(15, 30)
+            size = _randint(15, 30)
             colors = ["&HFFFFFF&", "&H00FFFF&", "&HFF00FF&", "&HFFFF00&"]
-            color = random.choice(colors)
+            color = _choice(colors)
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(start_ms + delay)},{self._ms_to_timestamp(start_ms + pixel_dur + 100)},Default,,0,0,0,,"
@@ -3237,7 +3384,7 @@ def _render_pixelate_form(self) -> str:
         # Main text appears
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms + pixel_dur)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\alpha&HFF&\\t(0,100,\\alpha&H00&)}}{text}"
+            f"{{{pos_tag}\\alpha&HFF&\\t(0,100,\\alpha&H00&)}}{text}"
         )
     return "\n".join(lines)
 
@@ -3245,6 +3392,7 @@ def _render_game_damage(self) -> str:
     """Game damage taken effect - red flash and shake."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3255,26 +3403,26 @@ def _render_game_damage(self) -> str:
         # Red screen flash
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + 150)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0000FF&\\blur30\\fscx300\\fscy300\\alpha&H80&"
+            f"{{{pos_tag}\\1c&H0000FF&\\blur30\\fscx300\\fscy300\\alpha&H80&"
             f"\\t(0,150,\\alpha&HFF&)}}●"
         )
         
         # Shake animation
         shake_anims = []
         for t in range(0, min(400, dur), 50):
-            shake_x = random.randint(-10, 10)
-            shake_y = random.randint(-5, 5)
+            shake_x = _randint(-10, 10)
+            shake_y = _randint(-5, 5)
             shake_anims.append(f"\\t({t},{t+25},\\pos({cx + shake_x},{cy + shake_y}))")
             shake_anims.append(f"\\t({t+25},{t+50},\\pos({cx},{cy}))")
         
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0000FF&\\t(0,200,\\1c&HFFFFFF&)"
+            f"{{{pos_tag}\\1c&H0000FF&\\t(0,200,\\1c&HFFFFFF&)"
             f"{''.join(shake_anims)}}}{text}"
         )
         
         # Damage numbers
-        damage = random.randint(50, 999)
+        damage = _randint(50, 999)
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + 500)},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx},{cy - 40})\\1c&H0000FF&\\fs30\\b1"
@@ -3286,6 +3434,7 @@ def _render_level_up(self) -> str:
     """RPG level up effect with sparkles and glow."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3302,25 +3451,25 @@ def _render_level_up(self) -> str:
         
         # Sparkles rising
         for _ in range(20):
-            px = cx + random.randint(-80, 80)
+            px = cx + _randint(-80, 80)
             start_py = cy + 50
-            end_py = cy - random.randint(50, 150)
-            p_start = start_ms + random.randint(0, 300)
+            end_py = cy - _randint(50, 150)
+            p_start = start_ms + _randint(0, 300)
             colors = ["&H00FFFF&", "&HFFFF00&", "&HFFFFFF&"]
             lines.append(
                 f"Dialogue: 1,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_start + 500)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({px},{start_py})\\1c{random.choice(colors)}\\blur1\\fscx8\\fscy8"
+                f"{{\\an5\\pos({px},{start_py})\\1c{_choice(colors)}\\blur1\\fscx8\\fscy8"
                 f"\\t(0,500,\\pos({px},{end_py})\\alpha&HFF&)}}✦"
             )
         
         # Main text with golden glow
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + 200)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H00D4FF&\\blur10\\alpha&H60&\\fscx110\\fscy110}}{text}"
+            f"{{{pos_tag}\\1c&H00D4FF&\\blur10\\alpha&H60&\\fscx110\\fscy110}}{text}"
         )
         lines.append(
             f"Dialogue: 3,{self._ms_to_timestamp(start_ms + 200)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx80\\fscy80\\t(0,200,\\fscx100\\fscy100)}}{text}"
+            f"{{{pos_tag}\\fscx80\\fscy80\\t(0,200,\\fscx100\\fscy100)}}{text}"
         )
     return "\n".join(lines)
 
@@ -3328,6 +3477,7 @@ def _render_coin_collect(self) -> str:
     """Coin collection game effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3336,9 +3486,10 @@ def _render_coin_collect(self) -> str:
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
         # Coin spinning animation (using fscx to simulate rotation)
-        coin_anims = ""
+        coin_parts = []
         for t in range(0, min(500, dur), 100):
-            coin_anims += f"\\t({t},{t+50},\\fscx0)\\t({t+50},{t+100},\\fscx100)"
+            coin_parts.append(f"\\t({t},{t+50},\\fscx0)\\t({t+50},{t+100},\\fscx100)")
+        coin_anims = "".join(coin_parts)
         
         # Coins bouncing up
         for i in range(5):
@@ -3355,13 +3506,13 @@ def _render_coin_collect(self) -> str:
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + 300)},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx + 80},{cy - 40})\\1c&H00FFFF&\\fs20\\b1"
-            f"\\t(0,300,\\pos({cx + 100},{cy - 60})\\alpha&HFF&)}}+{random.randint(10, 100)}"
+            f"\\t(0,300,\\pos({cx + 100},{cy - 60})\\alpha&HFF&)}}+{_randint(10, 100)}"
         )
         
         # Main text
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(100,100)}}{text}"
+            f"{{{pos_tag}\\fad(100,100)}}{text}"
         )
     return "\n".join(lines)
 
@@ -3369,6 +3520,7 @@ def _render_glitch_teleport(self) -> str:
     """Glitch teleport effect like video game respawn."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3380,27 +3532,27 @@ def _render_glitch_teleport(self) -> str:
         
         # Pre-teleport glitch fragments
         for i in range(8):
-            frag_x = cx + random.randint(-150, 150)
-            frag_y = cy + random.randint(-80, 80)
+            frag_x = cx + _randint(-150, 150)
+            frag_y = cy + _randint(-80, 80)
             delay = i * 30
             colors = ["&H00FFFF&", "&HFF00FF&", "&H00FF00&"]
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(start_ms + delay)},{self._ms_to_timestamp(start_ms + glitch_dur)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({frag_x},{frag_y})\\1c{random.choice(colors)}\\blur1\\fscx{random.randint(50, 150)}\\fscy{random.randint(3, 10)}"
+                f"{{\\an5\\pos({frag_x},{frag_y})\\1c{_choice(colors)}\\blur1\\fscx{_randint(50, 150)}\\fscy{_randint(3, 10)}"
                 f"\\t(0,{glitch_dur - delay},\\pos({cx},{cy})\\alpha&HFF&)}}━"
             )
         
         # Teleport flash
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms + glitch_dur - 50)},{self._ms_to_timestamp(start_ms + glitch_dur + 100)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&HFFFFFF&\\blur30\\fscx200\\fscy200\\alpha&H40&"
+            f"{{{pos_tag}\\1c&HFFFFFF&\\blur30\\fscx200\\fscy200\\alpha&H40&"
             f"\\t(0,150,\\alpha&HFF&)}}●"
         )
         
         # Main text materializes
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + glitch_dur)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\alpha&HFF&\\blur5\\t(0,100,\\alpha&H00&\\blur0)}}{text}"
+            f"{{{pos_tag}\\alpha&HFF&\\blur5\\t(0,100,\\alpha&H00&\\blur0)}}{text}"
         )
     return "\n".join(lines)
 
@@ -3411,6 +3563,7 @@ def _render_tornado_spin(self) -> str:
     """Text caught in tornado - spins and stabilizes."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3422,12 +3575,12 @@ def _render_tornado_spin(self) -> str:
         
         # Debris particles spinning
         for _ in range(15):
-            angle = random.randint(0, 360)
-            radius = random.randint(50, 120)
+            angle = _randint(0, 360)
+            radius = _randint(50, 120)
             import math
-            start_x = cx + int(radius * 1.5 * (1 if random.random() > 0.5 else -1))
-            start_y = cy + random.randint(-80, 80)
-            p_start = start_ms + random.randint(0, spin_dur // 2)
+            start_x = cx + int(radius * 1.5 * (1 if _random() > 0.5 else -1))
+            start_y = cy + _randint(-80, 80)
+            p_start = start_ms + _randint(0, spin_dur // 2)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(start_ms + spin_dur)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({start_x},{start_y})\\1c&HCCCCCC&\\blur2\\fscx10\\fscy10"
@@ -3435,14 +3588,15 @@ def _render_tornado_spin(self) -> str:
             )
         
         # Text spinning in (using fscx to simulate rotation)
-        spin_anims = ""
+        spin_parts = []
         for t in range(0, spin_dur, 100):
             scale = 100 - int(80 * (1 - t / spin_dur))
-            spin_anims += f"\\t({t},{t+50},\\fscx5\\fscy{scale})\\t({t+50},{t+100},\\fscx{scale}\\fscy{scale})"
+            spin_parts.append(f"\\t({t},{t+50},\\fscx5\\fscy{scale})\\t({t+50},{t+100},\\fscx{scale}\\fscy{scale})")
+        spin_anims = "".join(spin_parts)
         
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx5\\fscy20\\blur5{spin_anims}"
+            f"{{{pos_tag}\\fscx5\\fscy20\\blur5{spin_anims}"
             f"\\t({spin_dur},{spin_dur + 100},\\blur0)}}{text}"
         )
     return "\n".join(lines)
@@ -3451,6 +3605,7 @@ def _render_underwater(self) -> str:
     """Underwater bubble effect with wavy motion."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3460,27 +3615,28 @@ def _render_underwater(self) -> str:
         
         # Rising bubbles
         for _ in range(12):
-            bx = cx + random.randint(-120, 120)
+            bx = cx + _randint(-120, 120)
             start_by = cy + 80
-            end_by = cy - random.randint(80, 150)
-            b_start = start_ms + random.randint(0, dur // 2)
-            size = random.randint(8, 20)
+            end_by = cy - _randint(80, 150)
+            b_start = start_ms + _randint(0, dur // 2)
+            size = _randint(8, 20)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(b_start)},{self._ms_to_timestamp(min(b_start + 800, end_ms))},Default,,0,0,0,,"
                 f"{{\\an5\\pos({bx},{start_by})\\1c&HFFFFCC&\\blur2\\alpha&H60&\\fscx{size}\\fscy{size}"
-                f"\\t(0,800,\\pos({bx + random.randint(-20, 20)},{end_by})\\alpha&HFF&)}}○"
+                f"\\t(0,800,\\pos({bx + _randint(-20, 20)},{end_by})\\alpha&HFF&)}}○"
             )
         
         # Wavy text motion
-        wave_anims = ""
+        wave_parts = []
         for t in range(0, dur, 200):
             offset = 5 if (t // 200) % 2 == 0 else -5
-            wave_anims += f"\\t({t},{t+100},\\pos({cx + offset},{cy}))\\t({t+100},{t+200},\\pos({cx - offset},{cy}))"
+            wave_parts.append(f"\\t({t},{t+100},\\pos({cx + offset},{cy}))\\t({t+100},{t+200},\\pos({cx - offset},{cy}))")
+        wave_anims = "".join(wave_parts)
         
         # Main text with blue tint
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&HFFCC88&\\blur1{wave_anims}}}{text}"
+            f"{{{pos_tag}\\1c&HFFCC88&\\blur1{wave_anims}}}{text}"
         )
     return "\n".join(lines)
 
@@ -3488,6 +3644,7 @@ def _render_sand_storm(self) -> str:
     """Sand storm with particles and reveal."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3501,20 +3658,20 @@ def _render_sand_storm(self) -> str:
         for _ in range(30):
             start_x = cx - 200
             end_x = cx + 200
-            py = cy + random.randint(-50, 50)
-            p_start = start_ms + random.randint(0, storm_dur)
-            size = random.randint(3, 8)
+            py = cy + _randint(-50, 50)
+            p_start = start_ms + _randint(0, storm_dur)
+            size = _randint(3, 8)
             colors = ["&H5599DD&", "&H77BBEE&", "&H88CCFF&"]
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_start + 300)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({start_x},{py})\\1c{random.choice(colors)}\\blur1\\fscx{size}\\fscy{size}"
-                f"\\t(0,300,\\pos({end_x},{py + random.randint(-10, 10)})\\alpha&HFF&)}}●"
+                f"{{\\an5\\pos({start_x},{py})\\1c{_choice(colors)}\\blur1\\fscx{size}\\fscy{size}"
+                f"\\t(0,300,\\pos({end_x},{py + _randint(-10, 10)})\\alpha&HFF&)}}●"
             )
         
         # Text revealed as storm clears
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H66AADD&\\blur10\\alpha&H80&"
+            f"{{{pos_tag}\\1c&H66AADD&\\blur10\\alpha&H80&"
             f"\\t(0,{storm_dur},\\blur0\\alpha&H00&)}}{text}"
         )
     return "\n".join(lines)
@@ -3523,10 +3680,12 @@ def _render_lava_melt(self) -> str:
     """Text melts like lava with dripping effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
@@ -3534,26 +3693,26 @@ def _render_lava_melt(self) -> str:
         
         # Main text with heat glow
         lines.append(
-            f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0066FF&\\blur0"
+            f"Dialogue: 2,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\1c&H0066FF&\\blur0"
             f"\\t({melt_start - start_ms},{end_ms - start_ms},\\1c&H0000FF&\\fscy150\\blur3)}}{text}"
         )
         
         # Glow underneath
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0033CC&\\blur15\\alpha&H60&}}{text}"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\1c&H0033CC&\\blur15\\alpha&H60&}}{text}"
         )
         
         # Lava drips
         for _ in range(6):
-            drip_x = cx + random.randint(-80, 80)
-            drip_start = melt_start + random.randint(0, 200)
-            drip_end_y = cy + random.randint(40, 100)
+            drip_x = cx + _randint(-80, 80)
+            drip_start = melt_start + _randint(0, 200)
+            drip_end_y = cy + _randint(40, 100)
             colors = ["&H0000FF&", "&H0033FF&", "&H0066FF&"]
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(drip_start)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({drip_x},{cy + 20})\\1c{random.choice(colors)}\\blur3\\fscx15\\fscy15"
+                f"{{\\an5\\pos({drip_x},{cy + 20})\\1c{_choice(colors)}\\blur3\\fscx15\\fscy15"
                 f"\\t(0,{end_ms - drip_start},\\pos({drip_x},{drip_end_y})\\fscy30)}}●"
             )
     return "\n".join(lines)
@@ -3562,6 +3721,7 @@ def _render_freeze_crack(self) -> str:
     """Ice freeze with cracking effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3573,9 +3733,9 @@ def _render_freeze_crack(self) -> str:
         
         # Ice crystals forming
         for _ in range(10):
-            cx_off = random.randint(-100, 100)
-            cy_off = random.randint(-40, 40)
-            p_start = start_ms + random.randint(0, freeze_dur)
+            cx_off = _randint(-100, 100)
+            cy_off = _randint(-40, 40)
+            p_start = start_ms + _randint(0, freeze_dur)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({cx + cx_off},{cy + cy_off})\\1c&HFFFFCC&\\blur2\\fscx0\\fscy0"
@@ -3585,19 +3745,19 @@ def _render_freeze_crack(self) -> str:
         # Text with ice color transition
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&HFFFFFF&"
+            f"{{{pos_tag}\\1c&HFFFFFF&"
             f"\\t(0,{freeze_dur},\\1c&HFFEECC&\\blur0.5)}}{text}"
         )
         
         # Crack lines appearing
         crack_start = start_ms + freeze_dur
         for i in range(5):
-            angle = random.randint(-30, 30)
-            crack_x = cx + random.randint(-60, 60)
+            angle = _randint(-30, 30)
+            crack_x = cx + _randint(-60, 60)
             lines.append(
                 f"Dialogue: 2,{self._ms_to_timestamp(crack_start + i * 50)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({crack_x},{cy})\\1c&HFFFFEE&\\blur0\\fscx0\\frz{angle}"
-                f"\\t(0,100,\\fscx{random.randint(20, 50)})}}━"
+                f"\\t(0,100,\\fscx{_randint(20, 50)})}}━"
             )
     return "\n".join(lines)
 
@@ -3608,6 +3768,7 @@ def _render_magic_spell(self) -> str:
     """Magic spell casting with runes and energy."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3628,29 +3789,29 @@ def _render_magic_spell(self) -> str:
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(start_ms + delay)},{self._ms_to_timestamp(start_ms + cast_dur + 200)},Default,,0,0,0,,"
                 f"{{\\an5\\pos({rx},{ry})\\1c&HFF66FF&\\blur2\\fscx0\\fscy0\\frz{angle}"
-                f"\\t(0,150,\\fscx25\\fscy25)\\t({cast_dur},{cast_dur + 200},\\alpha&HFF&)}}{random.choice(runes)}"
+                f"\\t(0,150,\\fscx25\\fscy25)\\t({cast_dur},{cast_dur + 200},\\alpha&HFF&)}}{_choice(runes)}"
             )
         
         # Energy converging
         for _ in range(10):
-            start_x = cx + random.randint(-150, 150)
-            start_y = cy + random.randint(-100, 100)
-            p_start = start_ms + random.randint(0, cast_dur // 2)
+            start_x = cx + _randint(-150, 150)
+            start_y = cy + _randint(-100, 100)
+            p_start = start_ms + _randint(0, cast_dur // 2)
             colors = ["&HFF00FF&", "&HFF66FF&", "&HFFAAFF&"]
             lines.append(
                 f"Dialogue: 1,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(start_ms + cast_dur)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({start_x},{start_y})\\1c{random.choice(colors)}\\blur3\\fscx8\\fscy8"
+                f"{{\\an5\\pos({start_x},{start_y})\\1c{_choice(colors)}\\blur3\\fscx8\\fscy8"
                 f"\\t(0,{cast_dur - (p_start - start_ms)},\\pos({cx},{cy})\\alpha&HFF&)}}✦"
             )
         
         # Main text with magical glow
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + cast_dur)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&HFFAAFF&\\blur10\\alpha&H60&\\fscx120\\fscy120}}{text}"
+            f"{{{pos_tag}\\1c&HFFAAFF&\\blur10\\alpha&H60&\\fscx120\\fscy120}}{text}"
         )
         lines.append(
             f"Dialogue: 3,{self._ms_to_timestamp(start_ms + cast_dur)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx80\\fscy80\\alpha&HFF&"
+            f"{{{pos_tag}\\fscx80\\fscy80\\alpha&HFF&"
             f"\\t(0,100,\\fscx100\\fscy100\\alpha&H00&)}}{text}"
         )
     return "\n".join(lines)
@@ -3659,6 +3820,7 @@ def _render_portal_warp(self) -> str:
     """Portal warp effect - text emerges from portal."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3674,7 +3836,7 @@ def _render_portal_warp(self) -> str:
             size = 50 + i * 30
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(start_ms + delay)},{self._ms_to_timestamp(start_ms + portal_dur + 100)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\1c&HFF9900&\\blur5\\fscx0\\fscy0\\bord3\\3c&H0066FF&"
+                f"{{{pos_tag}\\1c&HFF9900&\\blur5\\fscx0\\fscy0\\bord3\\3c&H0066FF&"
                 f"\\t(0,{portal_dur - delay},\\fscx{size}\\fscy{int(size * 0.4)}\\alpha&HFF&)}}○"
             )
         
@@ -3698,7 +3860,7 @@ def _render_portal_warp(self) -> str:
         # Text emerging from portal
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + portal_dur // 2)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx0\\fscy0\\blur10"
+            f"{{{pos_tag}\\fscx0\\fscy0\\blur10"
             f"\\t(0,{portal_dur // 2},\\fscx100\\fscy100\\blur0)}}{text}"
         )
     return "\n".join(lines)
@@ -3707,6 +3869,7 @@ def _render_invisibility_cloak(self) -> str:
     """Invisibility cloak - shimmer reveal effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3727,15 +3890,16 @@ def _render_invisibility_cloak(self) -> str:
             )
         
         # Text with flicker visibility
-        flicker_anims = ""
+        flicker_parts = []
         for t in range(0, reveal_dur, 60):
-            alpha1 = "FF" if random.random() > 0.5 else "80"
+            alpha1 = "FF" if _random() > 0.5 else "80"
             alpha2 = "00" if t > reveal_dur * 0.7 else "60"
-            flicker_anims += f"\\t({t},{t+30},\\alpha&H{alpha1}&)\\t({t+30},{t+60},\\alpha&H{alpha2}&)"
+            flicker_parts.append(f"\\t({t},{t+30},\\alpha&H{alpha1}&)\\t({t+30},{t+60},\\alpha&H{alpha2}&)")
+        flicker_anims = "".join(flicker_parts)
         
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\alpha&HFF&{flicker_anims}"
+            f"{{{pos_tag}\\alpha&HFF&{flicker_anims}"
             f"\\t({reveal_dur},{reveal_dur + 100},\\alpha&H00&)}}{text}"
         )
     return "\n".join(lines)
@@ -3744,6 +3908,7 @@ def _render_summon_appear(self) -> str:
     """Summoning circle with entity appearing."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3756,7 +3921,7 @@ def _render_summon_appear(self) -> str:
         # Summoning circle glow
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + summon_dur + 200)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H00FF66&\\blur20\\fscx150\\fscy60\\alpha&H80&"
+            f"{{{pos_tag}\\1c&H00FF66&\\blur20\\fscx150\\fscy60\\alpha&H80&"
             f"\\t(0,{summon_dur},\\blur30\\fscx180\\fscy70)\\t({summon_dur},{summon_dur + 200},\\alpha&HFF&)}}○"
         )
         
@@ -3784,7 +3949,7 @@ def _render_summon_appear(self) -> str:
         # Main text appearing
         lines.append(
             f"Dialogue: 3,{self._ms_to_timestamp(start_ms + summon_dur)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\alpha&HFF&\\fscx150\\fscy150\\blur5"
+            f"{{{pos_tag}\\alpha&HFF&\\fscx150\\fscy150\\blur5"
             f"\\t(0,150,\\alpha&H00&\\fscx100\\fscy100\\blur0)}}{text}"
         )
     return "\n".join(lines)
@@ -3793,23 +3958,25 @@ def _render_fairy_dust(self) -> str:
     """Fairy dust sparkles trailing effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
         # Continuous fairy dust sparkles
         for _ in range(25):
-            px = cx + random.randint(-120, 120)
-            py = cy + random.randint(-50, 50)
-            p_start = start_ms + random.randint(0, dur - 300)
+            px = cx + _randint(-120, 120)
+            py = cy + _randint(-50, 50)
+            p_start = start_ms + _randint(0, dur - 300)
             colors = ["&HFFFF00&", "&HFFAAFF&", "&H00FFFF&", "&HFFFFFF&"]
-            size = random.randint(5, 15)
+            size = _randint(5, 15)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(p_start)},{self._ms_to_timestamp(p_start + 400)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({px},{py})\\1c{random.choice(colors)}\\blur1\\fscx{size}\\fscy{size}"
+                f"{{\\an5\\pos({px},{py})\\1c{_choice(colors)}\\blur1\\fscx{size}\\fscy{size}"
                 f"\\t(0,200,\\fscx{size + 10}\\fscy{size + 10})\\t(200,400,\\alpha&HFF&\\fscx0\\fscy0)}}✦"
             )
         
@@ -3826,12 +3993,12 @@ def _render_fairy_dust(self) -> str:
         
         # Main text with soft glow
         lines.append(
-            f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur5\\alpha&H60&\\fscx110\\fscy110}}{text}"
+            f"Dialogue: 2,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\blur5\\alpha&H60&\\fscx110\\fscy110}}{text}"
         )
         lines.append(
-            f"Dialogue: 3,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fad(150,150)}}{text}"
+            f"Dialogue: 3,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\fad(150,150)}}{text}"
         )
     return "\n".join(lines)
 
@@ -3842,6 +4009,7 @@ def _render_like_burst(self) -> str:
     """Social media like burst with hearts."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3852,30 +4020,30 @@ def _render_like_burst(self) -> str:
         # Heart burst
         hearts = ["♥", "♡", "❤"]
         for _ in range(15):
-            hx = cx + random.randint(-30, 30)
+            hx = cx + _randint(-30, 30)
             hy = cy
-            end_hx = cx + random.randint(-150, 150)
-            end_hy = cy - random.randint(50, 150)
-            h_start = start_ms + random.randint(0, 200)
-            size = random.randint(15, 35)
+            end_hx = cx + _randint(-150, 150)
+            end_hy = cy - _randint(50, 150)
+            h_start = start_ms + _randint(0, 200)
+            size = _randint(15, 35)
             colors = ["&H0000FF&", "&H0066FF&", "&HFF00FF&"]
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(h_start)},{self._ms_to_timestamp(h_start + 500)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({hx},{hy})\\1c{random.choice(colors)}\\fscx{size}\\fscy{size}"
-                f"\\t(0,500,\\pos({end_hx},{end_hy})\\alpha&HFF&\\fscx{size + 10}\\fscy{size + 10})}}{random.choice(hearts)}"
+                f"{{\\an5\\pos({hx},{hy})\\1c{_choice(colors)}\\fscx{size}\\fscy{size}"
+                f"\\t(0,500,\\pos({end_hx},{end_hy})\\alpha&HFF&\\fscx{size + 10}\\fscy{size + 10})}}{_choice(hearts)}"
             )
         
         # Like button pop
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + 300)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0000FF&\\fscx200\\fscy200"
+            f"{{{pos_tag}\\1c&H0000FF&\\fscx200\\fscy200"
             f"\\t(0,150,\\fscx250\\fscy250)\\t(150,300,\\fscx200\\fscy200\\alpha&HFF&)}}♥"
         )
         
         # Main text
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + 100)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx80\\fscy80\\t(0,150,\\fscx100\\fscy100)}}{text}"
+            f"{{{pos_tag}\\fscx80\\fscy80\\t(0,150,\\fscx100\\fscy100)}}{text}"
         )
     return "\n".join(lines)
 
@@ -3883,10 +4051,12 @@ def _render_story_swipe(self) -> str:
     """Instagram story swipe transition."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
@@ -3895,21 +4065,21 @@ def _render_story_swipe(self) -> str:
         # Previous content sliding out
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + swipe_dur)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\alpha&H80&"
+            f"{{{pos_tag}\\alpha&H80&"
             f"\\t(0,{swipe_dur},\\pos({cx - 300},{cy})\\alpha&HFF&)}}"
             f"━━━━━━"
         )
         
         # New content sliding in
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an5\\pos({cx + 300},{cy})"
             f"\\t(0,{swipe_dur},\\pos({cx},{cy}))}}{text}"
         )
         
         # Progress bar at top
         lines.append(
-            f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+            f"Dialogue: 2,{start_ts},{end_ts},Default,,0,0,0,,"
             f"{{\\an8\\pos({cx - 100},{cy - 80})\\1c&HFFFFFF&\\fscx0\\fscy3"
             f"\\t(0,{dur},\\fscx200)}}█"
         )
@@ -3961,6 +4131,7 @@ def _render_trending_fire(self) -> str:
     """Trending/viral fire effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -3970,16 +4141,16 @@ def _render_trending_fire(self) -> str:
         
         # Fire particles rising
         for _ in range(20):
-            fx = cx + random.randint(-80, 80)
+            fx = cx + _randint(-80, 80)
             start_fy = cy + 30
-            end_fy = cy - random.randint(40, 100)
-            f_start = start_ms + random.randint(0, dur - 400)
+            end_fy = cy - _randint(40, 100)
+            f_start = start_ms + _randint(0, dur - 400)
             colors = ["&H0000FF&", "&H0066FF&", "&H00AAFF&", "&H00DDFF&"]
-            size = random.randint(10, 25)
+            size = _randint(10, 25)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(f_start)},{self._ms_to_timestamp(f_start + 400)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({fx},{start_fy})\\1c{random.choice(colors)}\\blur3\\fscx{size}\\fscy{size}"
-                f"\\t(0,400,\\pos({fx + random.randint(-20, 20)},{end_fy})\\fscx{size // 2}\\fscy{size // 2}\\alpha&HFF&)}}▲"
+                f"{{\\an5\\pos({fx},{start_fy})\\1c{_choice(colors)}\\blur3\\fscx{size}\\fscy{size}"
+                f"\\t(0,400,\\pos({fx + _randint(-20, 20)},{end_fy})\\fscx{size // 2}\\fscy{size // 2}\\alpha&HFF&)}}▲"
             )
         
         # Fire emoji burst
@@ -3994,13 +4165,14 @@ def _render_trending_fire(self) -> str:
             )
         
         # Main text with heat shimmer
-        shimmer = ""
+        shimmer_parts = []
         for t in range(0, dur, 100):
-            shimmer += f"\\t({t},{t+50},\\fscx102)\\t({t+50},{t+100},\\fscx100)"
+            shimmer_parts.append(f"\\t({t},{t+50},\\fscx102)\\t({t+50},{t+100},\\fscx100)")
+        shimmer = "".join(shimmer_parts)
         
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H00AAFF&{shimmer}}}{text}"
+            f"{{{pos_tag}\\1c&H00AAFF&{shimmer}}}{text}"
         )
     return "\n".join(lines)
 
@@ -4008,6 +4180,7 @@ def _render_viral_shake(self) -> str:
     """Viral content shake effect with notifications."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -4016,17 +4189,18 @@ def _render_viral_shake(self) -> str:
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
         # Intense shake animation
-        shake_anims = ""
+        shake_parts = []
         for t in range(0, min(500, dur), 40):
-            sx = random.randint(-8, 8)
-            sy = random.randint(-4, 4)
-            shake_anims += f"\\t({t},{t+20},\\pos({cx + sx},{cy + sy}))\\t({t+20},{t+40},\\pos({cx},{cy}))"
+            sx = _randint(-8, 8)
+            sy = _randint(-4, 4)
+            shake_parts.append(f"\\t({t},{t+20},\\pos({cx + sx},{cy + sy}))\\t({t+20},{t+40},\\pos({cx},{cy}))")
+        shake_anims = "".join(shake_parts)
         
         # Notification badges popping
         notifs = ["+1K", "+5K", "+10K", "🔔", "💬", "🔁"]
         for i in range(6):
-            nx = cx + random.randint(-100, 100)
-            ny = cy + random.randint(-60, 60)
+            nx = cx + _randint(-100, 100)
+            ny = cy + _randint(-60, 60)
             n_start = start_ms + i * 80
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(n_start)},{self._ms_to_timestamp(n_start + 300)},Default,,0,0,0,,"
@@ -4037,7 +4211,7 @@ def _render_viral_shake(self) -> str:
         # Main text with shake
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy}){shake_anims}}}{text}"
+            f"{{{pos_tag}{shake_anims}}}{text}"
         )
     return "\n".join(lines)
 
@@ -4048,10 +4222,12 @@ def _render_disco_ball(self) -> str:
     """Disco ball with rotating light reflections."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
@@ -4067,20 +4243,21 @@ def _render_disco_ball(self) -> str:
             end_y = cy + int(radius * 0.5 * math.sin(math.radians(angle_start + 180)))
             
             lines.append(
-                f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
+                f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,"
                 f"{{\\an5\\pos({start_x},{start_y})\\1c{colors[i % 6]}\\blur10\\fscx40\\fscy40\\alpha&H60&"
                 f"\\t(0,{dur},\\pos({end_x},{end_y}))}}●"
             )
         
         # Color cycling text
-        color_cycle = ""
+        cycle_parts = []
         for t in range(0, dur, 200):
             color = colors[t // 200 % len(colors)]
-            color_cycle += f"\\t({t},{t+200},\\1c{color})"
+            cycle_parts.append(f"\\t({t},{t+200},\\1c{color})")
+        color_cycle = "".join(cycle_parts)
         
         lines.append(
-            f"Dialogue: 1,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur1{color_cycle}}}{text}"
+            f"Dialogue: 1,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\blur1{color_cycle}}}{text}"
         )
     return "\n".join(lines)
 
@@ -4088,6 +4265,7 @@ def _render_fireworks(self) -> str:
     """Fireworks explosion effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -4124,7 +4302,7 @@ def _render_fireworks(self) -> str:
         # Main text
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + 200)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx80\\fscy80\\t(0,200,\\fscx100\\fscy100)}}{text}"
+            f"{{{pos_tag}\\fscx80\\fscy80\\t(0,200,\\fscx100\\fscy100)}}{text}"
         )
     return "\n".join(lines)
 
@@ -4132,6 +4310,7 @@ def _render_balloon_pop(self) -> str:
     """Balloon pop with confetti."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -4144,14 +4323,14 @@ def _render_balloon_pop(self) -> str:
         # Balloon inflating then popping
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(start_ms + pop_time)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H0066FF&\\blur0\\fscx50\\fscy50"
+            f"{{{pos_tag}\\1c&H0066FF&\\blur0\\fscx50\\fscy50"
             f"\\t(0,{pop_time - 50},\\fscx150\\fscy180)\\t({pop_time - 50},{pop_time},\\fscx300\\fscy300\\alpha&HFF&)}}●"
         )
         
         # Pop flash
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms + pop_time - 30)},{self._ms_to_timestamp(start_ms + pop_time + 100)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&HFFFFFF&\\blur15\\fscx200\\fscy200\\alpha&H60&"
+            f"{{{pos_tag}\\1c&HFFFFFF&\\blur15\\fscx200\\fscy200\\alpha&H60&"
             f"\\t(0,130,\\alpha&HFF&)}}●"
         )
         
@@ -4159,20 +4338,20 @@ def _render_balloon_pop(self) -> str:
         confetti_chars = ["■", "●", "▲", "★"]
         colors = ["&H0000FF&", "&H00FF00&", "&HFFFF00&", "&HFF00FF&", "&H00FFFF&", "&HFF6600&"]
         for _ in range(25):
-            end_cx = cx + random.randint(-150, 150)
-            end_cy = cy + random.randint(-100, 100)
+            end_cx = cx + _randint(-150, 150)
+            end_cy = cy + _randint(-100, 100)
             c_start = start_ms + pop_time
-            rotation = random.randint(0, 720)
+            rotation = _randint(0, 720)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(c_start)},{self._ms_to_timestamp(c_start + 600)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\1c{random.choice(colors)}\\fscx15\\fscy15\\frz0"
-                f"\\t(0,600,\\pos({end_cx},{end_cy})\\frz{rotation}\\alpha&HFF&)}}{random.choice(confetti_chars)}"
+                f"{{{pos_tag}\\1c{_choice(colors)}\\fscx15\\fscy15\\frz0"
+                f"\\t(0,600,\\pos({end_cx},{end_cy})\\frz{rotation}\\alpha&HFF&)}}{_choice(confetti_chars)}"
             )
         
         # Main text appears after pop
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + pop_time)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\fscx150\\fscy150\\t(0,150,\\fscx100\\fscy100)}}{text}"
+            f"{{{pos_tag}\\fscx150\\fscy150\\t(0,150,\\fscx100\\fscy100)}}{text}"
         )
     return "\n".join(lines)
 
@@ -4180,6 +4359,7 @@ def _render_jackpot_spin(self) -> str:
     """Slot machine jackpot spin effect."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
@@ -4206,25 +4386,25 @@ def _render_jackpot_spin(self) -> str:
         # Final reveal with flash
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(start_ms + spin_dur)},{self._ms_to_timestamp(start_ms + spin_dur + 100)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H00FFFF&\\blur20\\fscx200\\fscy200\\alpha&H60&"
+            f"{{{pos_tag}\\1c&H00FFFF&\\blur20\\fscx200\\fscy200\\alpha&H60&"
             f"\\t(0,100,\\alpha&HFF&)}}●"
         )
         
         # Coins/stars flying
         for _ in range(12):
-            end_sx = cx + random.randint(-120, 120)
-            end_sy = cy - random.randint(50, 120)
+            end_sx = cx + _randint(-120, 120)
+            end_sy = cy - _randint(50, 120)
             s_start = start_ms + spin_dur
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(s_start)},{self._ms_to_timestamp(s_start + 400)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})\\1c&H00DDFF&\\fscx20\\fscy20"
+                f"{{{pos_tag}\\1c&H00DDFF&\\fscx20\\fscy20"
                 f"\\t(0,400,\\pos({end_sx},{end_sy})\\alpha&HFF&)}}★"
             )
         
         # Main text - JACKPOT!
         lines.append(
             f"Dialogue: 2,{self._ms_to_timestamp(start_ms + spin_dur)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\1c&H00FFFF&\\fscx80\\fscy80"
+            f"{{{pos_tag}\\1c&H00FFFF&\\fscx80\\fscy80"
             f"\\t(0,200,\\fscx110\\fscy110)\\t(200,400,\\fscx100\\fscy100)}}{text}"
         )
     return "\n".join(lines)
@@ -4233,10 +4413,12 @@ def _render_party_mode(self) -> str:
     """Ultimate party mode with all effects combined."""
     lines = [self.render_ass_header()]
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     for word in self.words:
         start_ms = int(word.get("start", 0) * 1000)
         end_ms = int(word.get("end", start_ms / 1000) * 1000)
+        start_ts, end_ts = self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms)
         dur = max(1, end_ms - start_ms)
         text = (word.get("text") or "").replace("{", r"\{").replace("}", r"\}")
         
@@ -4244,14 +4426,14 @@ def _render_party_mode(self) -> str:
         
         # Confetti rain
         for _ in range(20):
-            rx = cx + random.randint(-200, 200)
+            rx = cx + _randint(-200, 200)
             start_ry = cy - 100
             end_ry = cy + 100
-            r_start = start_ms + random.randint(0, dur - 500)
+            r_start = start_ms + _randint(0, dur - 500)
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(r_start)},{self._ms_to_timestamp(r_start + 500)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({rx},{start_ry})\\1c{random.choice(colors)}\\fscx10\\fscy10\\frz0"
-                f"\\t(0,500,\\pos({rx + random.randint(-30, 30)},{end_ry})\\frz{random.randint(180, 720)}\\alpha&HFF&)}}■"
+                f"{{\\an5\\pos({rx},{start_ry})\\1c{_choice(colors)}\\fscx10\\fscy10\\frz0"
+                f"\\t(0,500,\\pos({rx + _randint(-30, 30)},{end_ry})\\frz{_randint(180, 720)}\\alpha&HFF&)}}■"
             )
         
         # Bouncing emojis
@@ -4268,25 +4450,27 @@ def _render_party_mode(self) -> str:
             )
         
         # Rainbow color cycling glow
-        color_cycle = ""
+        cycle_parts = []
         for t in range(0, dur, 150):
             color = colors[t // 150 % len(colors)]
-            color_cycle += f"\\t({t},{t+150},\\1c{color})"
+            cycle_parts.append(f"\\t({t},{t+150},\\1c{color})")
+        color_cycle = "".join(cycle_parts)
         
         # Glow layer
         lines.append(
-            f"Dialogue: 2,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur15\\alpha&H60&\\fscx115\\fscy115{color_cycle}}}{text}"
+            f"Dialogue: 2,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}\\blur15\\alpha&H60&\\fscx115\\fscy115{color_cycle}}}{text}"
         )
         
         # Main text with pulse
-        pulse = ""
+        pulse_parts = []
         for t in range(0, dur, 300):
-            pulse += f"\\t({t},{t+150},\\fscx105\\fscy105)\\t({t+150},{t+300},\\fscx100\\fscy100)"
+            pulse_parts.append(f"\\t({t},{t+150},\\fscx105\\fscy105)\\t({t+150},{t+300},\\fscx100\\fscy100)")
+        pulse = "".join(pulse_parts)
         
         lines.append(
-            f"Dialogue: 3,{self._ms_to_timestamp(start_ms)},{self._ms_to_timestamp(end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy}){pulse}}}{text}"
+            f"Dialogue: 3,{start_ts},{end_ts},Default,,0,0,0,,"
+            f"{{{pos_tag}{pulse}}}{text}"
         )
     return "\n".join(lines)
 
@@ -4296,6 +4480,7 @@ def _render_party_mode(self) -> str:
 def _render_karaoke_glow(self) -> str:
     """Karaoke effect where active word glows while filling - blur + color change combo."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4360,13 +4545,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         # Glow layer (background blur)
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(group_start_ms)},{self._ms_to_timestamp(group_end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur15\\alpha&H60&\\1c{glow_color}}}{full_text}"
+            f"{{{pos_tag}\\blur15\\alpha&H60&\\1c{glow_color}}}{full_text}"
         )
         
         # Main text layer
         lines.append(
             f"Dialogue: 1,{self._ms_to_timestamp(group_start_ms)},{self._ms_to_timestamp(group_end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})\\blur0}}{full_text}"
+            f"{{{pos_tag}\\blur0}}{full_text}"
         )
     
     return "\n".join(lines)
@@ -4374,6 +4559,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_karaoke_bounce_fill(self) -> str:
     """Karaoke effect where each word bounces while filling - fill + scale animation."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4444,7 +4630,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -4452,6 +4638,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_karaoke_color_cycle(self) -> str:
     """Karaoke effect where filled words cycle through rainbow colors."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4528,7 +4715,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -4536,6 +4723,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_pulse_highlight(self) -> str:
     """Active word pulses like a heartbeat - scale animation 100% -> 120% -> 100%."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4605,7 +4793,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -4613,6 +4801,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_spotlight(self) -> str:
     """Active word is bright while others are dark/blurred - spotlight effect."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4677,7 +4866,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             # Add spotlight glow behind active word
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -4685,6 +4874,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_flip_3d(self) -> str:
     """Word flips in 3D to become active - frx, fry rotation animations."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4752,7 +4942,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -4760,6 +4950,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_rainbow_karaoke(self) -> str:
     """Each character has different color - rainbow effect per character."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4805,20 +4996,21 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         # Build rainbow colored text
         all_text = " ".join([(w.get("text") or "") for w in group])
-        rainbow_text = ""
+        rainbow_parts = []
         color_idx = 0
         
         for char in all_text:
             if char == " ":
-                rainbow_text += " "
+                rainbow_parts.append(" ")
             else:
                 color = rainbow_colors[color_idx % len(rainbow_colors)]
-                rainbow_text += f"{{\\1c{color}}}{char}"
+                rainbow_parts.append(f"{{\\1c{color}}}{char}")
                 color_idx += 1
+        rainbow_text = "".join(rainbow_parts)
         
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(group_start_ms)},{self._ms_to_timestamp(group_end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})}}{rainbow_text}"
+            f"{{{pos_tag}}}{rainbow_text}"
         )
     
     return "\n".join(lines)
@@ -4826,6 +5018,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_gradient_fill(self) -> str:
     """Word fills with gradient colors instead of single color."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4881,11 +5074,12 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             # Build gradient transition for active word
             gradient_step = word_dur // len(gradient_colors)
-            gradient_anim = ""
+            gradient_parts = []
             for i, color in enumerate(gradient_colors):
                 t_start = i * gradient_step
                 t_end = (i + 1) * gradient_step
-                gradient_anim += f"\\t({t_start},{t_end},\\1c{color})"
+                gradient_parts.append(f"\\t({t_start},{t_end},\\1c{color})")
+            gradient_anim = "".join(gradient_parts)
             
             text_parts = []
             for idx, w in enumerate(group):
@@ -4905,7 +5099,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -4913,6 +5107,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_typewriter_karaoke(self) -> str:
     """Characters appear one by one (typewriter) + karaoke fill."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -4982,7 +5177,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         lines.append(
             f"Dialogue: 0,{self._ms_to_timestamp(group_start_ms)},{self._ms_to_timestamp(group_end_ms)},Default,,0,0,0,,"
-            f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+            f"{{{pos_tag}}}{full_text}"
         )
     
     return "\n".join(lines)
@@ -4990,6 +5185,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def _render_fade_word(self) -> str:
     """Each word fades in and out - fade + position animation."""
     cx, cy = self._get_center_coordinates()
+    pos_tag = f"\\an5\\pos({cx},{cy})"
     
     font = self.style.get("font", "Arial")
     font_size = int(self.style.get("font_size", 72))
@@ -5059,7 +5255,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             lines.append(
                 f"Dialogue: 0,{self._ms_to_timestamp(word_start_ms)},{self._ms_to_timestamp(line_end_ms)},Default,,0,0,0,,"
-                f"{{\\an5\\pos({cx},{cy})}}{full_text}"
+                f"{{{pos_tag}}}{full_text}"
             )
     
     return "\n".join(lines)
@@ -1,9 +1,38 @@
+from functools import lru_cache
 from typing import Any, List
 from ..utils import hex_to_ass, calculate_optimal_font_size_for_groups, get_font_path
 import os
 
 
+# typed=True: 2 and 2.0 (or 1 and True) format differently and must not share an entry
+@lru_cache(maxsize=64, typed=True)
+def _build_ass_header(
+    font, font_size, primary, secondary, outline, back, bold, italic,
+    spacing, angle, border, shadow, alignment, margin_l, margin_r, margin_v,
+) -> str:
+    """Format the ASS header for one style; renders sharing a style reuse the cached string."""
+    primary = hex_to_ass(primary)
+    secondary = hex_to_ass(secondary)
+    outline = hex_to_ass(outline)
+    back = hex_to_ass(back)
+    return """[Script Info]
+ScriptType: v4.00+
+PlayResX: 1920
+PlayResY: 1080
+Title: PyonFX Effect Subtitle
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,""" + font + f""",{font_size},{primary},{secondary},{outline},{back},{bold},{italic},0,0,100,100,{spacing},{angle},1,{border},{shadow},{alignment},{margin_l},{margin_r},{margin_v},0
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+
 class PyonFXRenderMixin:
+    __slots__ = ()
+
     def _get_optimized_font_size(self) -> int:
         """Calculate optimized font size that fits within video boundaries."""
         requested_size = int(self.style.get("font_size", 72))
@@ -75,6 +104,18 @@ class PyonFXRenderMixin:
         
         return cx, cy
 
+    def _sentence_chunks(self, sentence_length: int) -> List[tuple[str, str, str]]:
+        """Helper: Split words into fixed-size sentences as (start, end, escaped text) ASS tuples."""
+        chunks = []
+        words_list = self.words
+        for sent_start in range(0, len(words_list), sentence_length):
+            sent_words = words_list[sent_start:sent_start + sentence_length]
+            start_ms = int(sent_words[0].get("start", 0) * 1000)
+            end_ms = int(sent_words[-1].get("end", start_ms / 1000) * 1000)
+            full_text = " ".join([(w.get("text") or "").replace("{", r"\{").replace("}", r"\}") for w in sent_words])
+            chunks.append((self._ms_to_timestamp(start_ms), self._ms_to_timestamp(end_ms), full_text))
+        return chunks
+
     def _create_word_groups(self, max_words: int = 3, min_words: int = 2) -> List[List[dict]]:
         """Helper: Create dynamic word groups (2-3 words per group) respecting screen width."""
         font_size = int(self.style.get("font_size", 72))
@@ -120,32 +161,31 @@ class PyonFXRenderMixin:
 
     def render_ass_header(self, use_optimized_font: bool = True) -> str:
         """Generate ASS file header with optional font size optimization."""
-        primary = hex_to_ass(self.style.get("primary_color", "&H00FFFFFF"))
-        secondary = hex_to_ass(self.style.get("secondary_color", "&H00000000"))
-        outline = hex_to_ass(self.style.get("outline_color", "&H00000000"))
-        back = hex_to_ass(self.style.get("back_color", self.style.get("shadow_color", "&H00000000")))
-        border = self.style.get("border", 2)
-        shadow = self.style.get("shadow_blur", self.style.get("shadow", 0))
-        
         # Use optimized font size if enabled
         if use_optimized_font:
             font_size = self._get_optimized_font_size()
         else:
             font_size = self.style.get("font_size", 64)
-        
-        return """[Script Info]
-ScriptType: v4.00+
-PlayResX: 1920
-PlayResY: 1080
-Title: PyonFX Effect Subtitle
 
-[V4+ Styles]
-Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,""" + self.style.get("font", "Arial") + f""",{font_size},{primary},{secondary},{outline},{back},{self.style.get("bold", 1)},{self.style.get("italic", 0)},0,0,100,100,{self.style.get("spacing", 0)},{self.style.get("angle", 0)},1,{border},{shadow},{self.style.get("alignment", 2)},{self.style.get("margin_l", 10)},{self.style.get("margin_r", 10)},{self.style.get("margin_v", 10)},0
-
-[Events]
-Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
-"""
+        style = self.style
+        return _build_ass_header(
+            style.get("font", "Arial"),
+            font_size,
+            style.get("primary_color", "&H00FFFFFF"),
+            style.get("secondary_color", "&H00000000"),
+            style.get("outline_color", "&H00000000"),
+            style.get("back_color", style.get("shadow_color", "&H00000000")),
+            style.get("bold", 1),
+            style.get("italic", 0),
+            style.get("spacing", 0),
+            style.get("angle", 0),
+            style.get("border", 2),
+            style.get("shadow_blur", style.get("shadow", 0)),
+            style.get("alignment", 2),
+            style.get("margin_l", 10),
+            style.get("margin_r", 10),
+            style.get("margin_v", 10),
+        )
 
     def _build_effect_tags(self, duration_ms: int) -> str:
         """Build ASS animation tags for the effect"""
@@ -165,12 +205,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         return tags
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _ms_to_timestamp(ms: int) -> str:
-        """Convert milliseconds to ASS timestamp format"""
-        hours = ms // 3_600_000
-        minutes = (ms % 3_600_000) // 60_000
-        seconds = (ms % 60_000) // 1_000
-        centiseconds = (ms % 1_000) // 10
-        return f"{hours:d}:{minutes:02d}:{seconds:02d}.{centiseconds:02d}"
+        """Convert milliseconds to ASS timestamp format (memoized)"""
+        centiseconds, _ = divmod(ms, 10)
+        seconds, centiseconds = divmod(centiseconds, 100)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return "%d:%02d:%02d.%02d" % (hours, minutes, seconds, centiseconds)
 
 # Example usage function
@@ -1,4 +1,7 @@
 import math
+import re
+
+_HEX_RGB = re.compile(r"[0-9A-Fa-f]{6}")
 
 def ms_to_ass(ms: int) -> str:
     """Converts milliseconds to ASS timestamp format H:MM:SS.cc"""
@@ -14,9 +17,11 @@ def hex_to_ass(val: str) -> str:
     if not val: return "&H00FFFFFF"
     if val.startswith("&H"): return val
     val = val.lstrip("#")
-    if len(val) == 6:
-        r, g, b = val[0:2], val[2:4], val[4:6]
-        return f"&H00{b}{g}{r}" # Note BGR order
+    # Exactly six hex digits; int(..., 16) alone would also take "0x1234", "+12345", "12_345"
+    if _HEX_RGB.fullmatch(val):
+        rgb = int(val, 16)
+        # Swap R and B bytes in one integer op (note BGR order)
+        return f"&H00{((rgb & 0xFF) << 16) | (rgb & 0xFF00) | (rgb >> 16):06X}"
     return "&H00FFFFFF"
 
 def group_words_by_sentence(words: list, max_gap: float = 1.0) -> list:
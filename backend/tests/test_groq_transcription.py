@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("av")
+pytest.importorskip("groq")
+
+from services import groq_transcription
+
+
+def test_partial_chunked_transcript_is_not_cached(tmp_path, monkeypatch):
+    audio_path = tmp_path / "long.ogg"
+    audio_path.write_bytes(b"audio")
+    chunks = [(str(tmp_path / "chunk_000.ogg"), 0.0), (str(tmp_path / "chunk_001.ogg"), 600.0)]
+    uploads = []
+
+    def fake_upload(client, chunk_path, language, response_format):
+        uploads.append(chunk_path)
+        # Second chunk fails on its first upload only
+        if chunk_path == chunks[1][0] and uploads.count(chunk_path) == 1:
+            raise RuntimeError("rate limited")
+        return SimpleNamespace(
+            language="en",
+            duration=600.0,
+            segments=[{"start": 0.0, "end": 1.0, "text": chunk_path[-7:-4]}],
+            words=None,
+        )
+
+    monkeypatch.setattr(groq_transcription, "split_audio_for_groq", lambda *args: chunks)
+    monkeypatch.setattr(groq_transcription, "transcribe_single_file", fake_upload)
+    monkeypatch.setattr(
+        groq_transcription,
+        "transcribe_with_groq",
+        lambda path, language, response_format: groq_transcription.transcribe_chunked(
+            None, path, language, response_format, str(tmp_path)
+        ),
+    )
+    groq_transcription._transcribe_verbose_cached.cache_clear()
+
+    segments, _info = groq_transcription.transcribe_to_segments(str(audio_path))
+    assert [seg["text"] for seg in segments] == ["000"]
+
+    # The gap is retried rather than served from the cache
+    segments, info = groq_transcription.transcribe_to_segments(str(audio_path))
+    assert [seg["text"] for seg in segments] == ["000", "001"]
+    assert [seg["start"] for seg in segments] == [0.0, 600.0]
+    assert info["duration"] == 1200.0
+
+    # A complete transcript is cached
+    groq_transcription.transcribe_to_words(str(audio_path))
+    assert len(uploads) == 4
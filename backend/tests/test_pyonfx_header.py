@@ -0,0 +1,26 @@
+from styles.effects import PyonFXRenderer
+
+WORDS = [{"text": "Hello", "start": 0.0, "end": 1.0}]
+
+
+def _style_line(border, shadow):
+    style = {
+        "effect_type": "word_pop",
+        "font": "Arial",
+        "font_size": 72,
+        "primary_color": "#FFFFFF",
+        "border": border,
+        "shadow": shadow,
+    }
+    header = PyonFXRenderer(WORDS, style).render_ass_header()
+    return next(line for line in header.splitlines() if line.startswith("Style: Default,"))
+
+
+def test_header_cache_keeps_int_and_float_borders_apart():
+    int_line = _style_line(2, 0)
+    float_line = _style_line(2.0, 0.0)
+
+    assert ",1,2,0,2," in int_line
+    assert ",1,2.0,0.0,2," in float_line
+    # Cached int header is unaffected by the float render
+    assert _style_line(2, 0) == int_line
@@ -0,0 +1,31 @@
+import pytest
+
+from styles.effects import PyonFXRenderer
+
+BATCHED_EFFECTS = ["bubble_floral", "colorful", "ghost_star", "matrix_rain", "smoke_trail", "pixel_glitch", "falling_heart"]
+
+
+@pytest.mark.parametrize("effect_type", BATCHED_EFFECTS)
+def test_batched_particles_render_without_words(effect_type):
+    style = {"effect_type": effect_type, "font": "Arial", "font_size": 72, "effect_config": {"colors": []}}
+    output = PyonFXRenderer([], style).render()
+    assert output.startswith("[Script Info]")
+    assert "Dialogue:" not in output
+
+
+def test_colorful_empty_palette_keeps_text_and_skips_particles():
+    words = [{"text": "Hello", "start": 0.0, "end": 1.0}]
+    style = {"effect_type": "colorful", "font": "Arial", "font_size": 72, "effect_config": {"colors": []}}
+    dialogues = [line for line in PyonFXRenderer(words, style).render().splitlines() if line.startswith("Dialogue:")]
+    assert len(dialogues) == 1
+    assert dialogues[0].startswith("Dialogue: 1,")
+    assert dialogues[0].endswith("}Hello")
+    assert "\\p1" not in dialogues[0]
+
+
+def test_pixel_glitch_empty_palette_skips_batch_draw():
+    # pixel_glitch draws one text layer per palette color, so an empty palette has no layers
+    words = [{"text": "Hello", "start": 0.0, "end": 1.0}]
+    style = {"effect_type": "pixel_glitch", "font": "Arial", "font_size": 72, "effect_config": {"colors": []}}
+    output = PyonFXRenderer(words, style).render()
+    assert "Dialogue:" not in output
@@ -0,0 +1,13 @@
+import pytest
+
+from styles.utils import hex_to_ass
+
+
+def test_hex_to_ass_swaps_to_bgr():
+    assert hex_to_ass("#FF8800") == "&H000088FF"
+    assert hex_to_ass("12abef") == "&H00EFAB12"
+
+
+@pytest.mark.parametrize("val", ["0x1234", "+12345", "12_345", "-12345", " 12345", "GGGGGG", "#FFF"])
+def test_hex_to_ass_rejects_non_hex_digits(val):
+    assert hex_to_ass(val) == "&H00FFFFFF"